@@ -5,14 +5,15 @@ This module provides the main Chainlit application interface for the translator.
 It initializes necessary components and handles user interactions.
 """
 
+import asyncio
+import contextlib
 import logging
 import os
+import threading
+import time
+from collections import deque
 
 import chainlit as cl
-import psutil  # For memory tracking
-from limits import parse
-from limits.storage import MemoryStorage
-from limits.strategies import FixedWindowRateLimiter
 
 from config import settings
 from core.data_loader import load_vector_store_and_data
@@ -36,33 +37,31 @@ logger = logging.getLogger(__name__)
 # --- Memory Management Constants ---
 # Maximum number of message pairs (user+assistant) to keep in memory
 MAX_HISTORY_LENGTH = settings.MAX_HISTORY_LENGTH
+# Maximum number of individual messages kept (each exchange has 2 messages)
+MAX_HISTORY_MESSAGES = MAX_HISTORY_LENGTH * 2
+# Per-session keys stored by this app in cl.user_session
+SESSION_KEYS = ("message_history",)
+
+# --- Feature Flags (read once; settings do not change at runtime) ---
+DEBUG = settings.DEBUG
+ENABLE_RATE_LIMIT = settings.ENABLE_RATE_LIMIT
+
+# --- Chat Messages ---
+WELCOME_MESSAGE = (
+    "¡Bienvenido che! I'm your Argentinian Spanish translator. "
+    "Send me a message in English or Spanish, and I'll translate it "
+    "to casual Argentinian Spanish."
+)
 
 
-# Function to trim message history to prevent memory bloat
-def trim_message_history(session_id: str) -> None:
+def new_message_history() -> deque:
     """
-    Trims the message history for a session when it gets too long.
-    This helps prevent memory buildup in long conversations.
+    Creates an empty message history for a session.
 
-    Args:
-        session_id: The ID of the current session
+    The history is a bounded deque, so the oldest messages are dropped
+    automatically once it holds MAX_HISTORY_LENGTH exchanges.
     """
-    try:
-        # Get current message history
-        history = cl.user_session.get("message_history", [])
-
-        # If history exceeds max length, trim it
-        if len(history) > MAX_HISTORY_LENGTH * 2:  # Each exchange has 2 messages
-            # Keep only the most recent messages
-            history = history[-MAX_HISTORY_LENGTH * 2 :]
-            cl.user_session.set("message_history", history)
-            logger.info(
-                f"Trimmed message history for session {session_id} "
-                f"to {len(history)} messages"
-            )
-    except Exception as e:
-        # Log but don't crash if history trimming fails
-        logger.warning(f"Failed to trim message history: {e}")
+    return deque(maxlen=MAX_HISTORY_MESSAGES)
 
 
 # --- Global Initialization ---
@@ -71,39 +70,73 @@ prompt_manager = None
 vector_index = None
 translation_service = None
 INITIALIZATION_SUCCESSFUL = False
+# Shared task running the initialization, created by the first chat session
+_initialization_task = None
 
-try:
-    logger.info("Starting global initialization...")
-    # 1. Initialize Prompt Manager (uses settings internally)
-    prompt_manager = PromptManager()
 
-    # 2. Load data and create vector index with a limited dataset for debugging
-    # Use a small number like 20 to avoid hitting rate limits during testing
-    vector_index = load_vector_store_and_data(debug_limit=20)
+def initialize_services() -> None:
+    """
+    Builds the global prompt manager, vector index and translation service.
 
-    # 3. Initialize Translation Service (uses settings internally)
-    translation_service = TranslationService(
-        vector_index=vector_index, prompt_manager=prompt_manager
-    )
-    logger.info("Global initialization complete.")
-    INITIALIZATION_SUCCESSFUL = True
+    This does blocking I/O (CSV/JSONL reads, embedding requests), so it is run
+    in a worker thread by ensure_initialized() rather than on the event loop.
+    """
+    global prompt_manager, vector_index, translation_service
+    global INITIALIZATION_SUCCESSFUL
+    try:
+        logger.info("Starting global initialization...")
+        # 1. Initialize Prompt Manager (uses settings internally)
+        prompt_manager = PromptManager()
 
-# Catch specific initialization errors
-except (DataLoaderError, PromptError, AppError) as e:
-    logger.critical(
-        f"Fatal error during application initialization: {e}", exc_info=True
-    )
-    INITIALIZATION_SUCCESSFUL = False
-except Exception as e:
-    # Catch any other unexpected exceptions during init
-    logger.critical(
-        f"An unexpected fatal error occurred during application initialization: {e}",
-        exc_info=True,
-    )
-    INITIALIZATION_SUCCESSFUL = False
+        # 2. Load data and create vector index with a limited dataset for debugging
+        # Use a small number like 20 to avoid hitting rate limits during testing
+        vector_index = load_vector_store_and_data(debug_limit=20)
 
+        # 3. Initialize Translation Service (uses settings internally)
+        translation_service = TranslationService(
+            vector_index=vector_index, prompt_manager=prompt_manager
+        )
+        logger.info("Global initialization complete.")
+        INITIALIZATION_SUCCESSFUL = True
 
-# --- Rate Limiter for Messages (using 'limits' directly) ---
+    # Catch specific initialization errors
+    except (DataLoaderError, PromptError, AppError) as e:
+        logger.critical(
+            "Fatal error during application initialization: %s", e, exc_info=True
+        )
+        INITIALIZATION_SUCCESSFUL = False
+    except Exception as e:
+        # Catch any other unexpected exceptions during init
+        logger.critical(
+            "An unexpected fatal error occurred during application initialization: %s",
+            e,
+            exc_info=True,
+        )
+        INITIALIZATION_SUCCESSFUL = False
+
+
+async def ensure_initialized() -> bool:
+    """
+    Runs global initialization once, off the event loop.
+
+    Concurrent callers share the same task, so simultaneous chat starts wait
+    for a single load instead of each triggering one.
+
+    Returns:
+        True if the application initialized successfully.
+    """
+    global _initialization_task
+    _start_memory_poller()
+    if _initialization_task is None:
+        _initialization_task = asyncio.ensure_future(
+            asyncio.to_thread(initialize_services)
+        )
+    # Shield so a cancelled session does not cancel the shared load
+    await asyncio.shield(_initialization_task)
+    return INITIALIZATION_SUCCESSFUL
+
+
+# --- Rate Limiter for Messages (per-session token bucket) ---
 # Key function uses the Chainlit session ID
 def get_session_id():
     try:
@@ -114,29 +147,58 @@ def get_session_id():
         return "unknown_session"
 
 
-# Configure limits library directly for message limiting
-message_limit_storage = MemoryStorage()
-message_limit_strategy = FixedWindowRateLimiter(message_limit_storage)
-message_rate_limit = parse("5/minute")  # Use limits.parse
+# Token-bucket message limiting: each session holds (tokens, last_refill_time)
+# with a burst of MESSAGE_RATE_LIMIT that refills evenly over the window.
+# This is a single-process app, so a plain dict is enough and avoids the
+# generic storage layer of the 'limits' library.
+MESSAGE_RATE_LIMIT = 5  # Messages allowed per window
+MESSAGE_RATE_WINDOW_SECONDS = 60.0
+_MESSAGE_REFILL_RATE = MESSAGE_RATE_LIMIT / MESSAGE_RATE_WINDOW_SECONDS
+RATE_LIMIT_MESSAGE = (
+    f"Rate limit exceeded ({MESSAGE_RATE_LIMIT} messages per "
+    f"{MESSAGE_RATE_WINDOW_SECONDS:g} seconds). Please wait a moment."
+)
+_message_buckets: dict[str, tuple[float, float]] = {}
+
+
+def hit_message_rate_limit(session_id: str) -> bool:
+    """
+    Consumes a token from the session's bucket if one is available.
+
+    Args:
+        session_id: The ID of the current session
+
+    Returns:
+        True if the message is allowed, False if the limit is exceeded.
+    """
+    now = time.monotonic()
+    tokens, last_refill = _message_buckets.get(session_id, (MESSAGE_RATE_LIMIT, now))
+    tokens = min(
+        MESSAGE_RATE_LIMIT, tokens + (now - last_refill) * _MESSAGE_REFILL_RATE
+    )
+    if tokens < 1:
+        _message_buckets[session_id] = (tokens, now)
+        return False
+    _message_buckets[session_id] = (tokens - 1, now)
+    return True
 
 
 # --- Helper Functions for Message Processing ---
 async def check_initialization() -> bool:
     """Check if the application is properly initialized."""
-    if not INITIALIZATION_SUCCESSFUL:
+    if not await ensure_initialized():
         await cl.ErrorMessage(content="Application not initialized.").send()
         return False
     return True
 
 
 async def get_translation_service():
-    """Get the translation service from the user session."""
-    service = cl.user_session.get("translation_service")
+    """Get the process-wide translation service."""
+    service = translation_service
     if not service:
-        logger.error("TranslationService not found in user session.")
+        logger.error("TranslationService is not initialized.")
         await cl.ErrorMessage(
-            content="Error: Translation service unavailable. "
-            "Please restart the chat."
+            content="Error: Translation service unavailable. Please restart the chat."
         ).send()
         return None
     return service
@@ -166,30 +228,83 @@ class ChainlitCallbackHandler:
 
 
 async def perform_translation(service, message_content, callback_handler=None):
-    """Perform the actual translation using the service."""
-    if settings.DEBUG and callback_handler:
-        # In debug mode, just log the callback handler but don't use it
-        logger.info("Debug mode: callback handler is enabled but not used")
+    """
+    Perform the translation using the service, streaming it to the user.
 
-    # Show a simple progress step
-    async with cl.Step(name="Translating..."):
-        return await service.translate_text(message_content)
+    The reply message is shown as soon as the first token arrives, so the
+    streamed text itself serves as the progress indicator. A "Translating..."
+    step is only added in debug mode, saving a UI round-trip per message.
+
+    Returns:
+        The full content of the sent reply message.
+    """
+    if callback_handler and logger.isEnabledFor(logging.DEBUG):
+        # In debug mode, just log the callback handler but don't use it
+        logger.debug("Debug mode: callback handler is enabled but not used")
+
+    step = cl.Step(name="Translating...") if DEBUG else contextlib.nullcontext()
+    async with step:
+        reply = cl.Message(content="Translation: ")
+        streamed = False
+        try:
+            async for token in service.translate_text_stream(message_content):
+                await reply.stream_token(token)
+                streamed = True
+        except Exception:
+            # Take down the partial translation; the caller shows the error
+            if streamed:
+                await reply.remove()
+            raise
+        await reply.send()
+    return reply.content
+
+
+# Latest RSS sample in MB, refreshed by a background thread so that psutil
+# never runs on the message path
+_last_memory_mb = 0.0
+
+
+def _poll_memory_usage() -> None:
+    """Refreshes the cached memory sample every MEMORY_SAMPLE_INTERVAL seconds."""
+    global _last_memory_mb
+    # Imported here so psutil loads on the poller thread, not at app startup.
+    # The process handle is created once and reused for every sample.
+    import psutil
+
+    process = psutil.Process(os.getpid())
+    while True:
+        try:
+            _last_memory_mb = process.memory_info().rss / 1024 / 1024  # MB
+        except Exception as e:
+            logger.error("Failed to sample memory usage: %s", e)
+        time.sleep(settings.MEMORY_SAMPLE_INTERVAL)
+
+
+_memory_poller_started = False
+
+
+def _start_memory_poller() -> None:
+    """Starts the memory poller thread, once per process."""
+    global _memory_poller_started
+    if _memory_poller_started:
+        return
+    _memory_poller_started = True
+    threading.Thread(
+        target=_poll_memory_usage, name="memory-poller", daemon=True
+    ).start()
 
 
 async def log_memory_usage(session_id):
     """Log current memory usage for monitoring."""
     try:
-        # Use psutil to get memory info
-        process = psutil.Process(os.getpid())
-        memory_info = process.memory_info()
-        memory_mb = memory_info.rss / 1024 / 1024  # Convert to MB
-        logger.info(f"Memory usage: {memory_mb:.2f} MB for session {session_id}")
+        memory_mb = _last_memory_mb
+        logger.info("Memory usage: %.2f MB for session %s", memory_mb, session_id)
 
         # If memory usage is high, log a warning
         if memory_mb > 400:  # 400MB is getting close to the 512MB limit
-            logger.warning(f"High memory usage detected: {memory_mb:.2f} MB")
+            logger.warning("High memory usage detected: %.2f MB", memory_mb)
     except Exception as e:
-        logger.error(f"Failed to log memory usage: {e}")
+        logger.error("Failed to log memory usage: %s", e)
 
 
 # --- Chainlit Event Handlers ---
@@ -198,47 +313,45 @@ async def log_memory_usage(session_id):
 @cl.on_chat_start
 async def start():
     """Initialize the chat session."""
-    if not INITIALIZATION_SUCCESSFUL:
+    if not await ensure_initialized():
         await cl.ErrorMessage(
             content="Application failed to initialize. Please check the logs."
         ).send()
         return
 
-    # Store the globally initialized service in the user session
-    # This is generally safer than relying on global variables in async contexts
-    cl.user_session.set("translation_service", translation_service)
+    cl.user_session.set("message_history", new_message_history())
 
     # Send welcome message
-    await cl.Message(
-        content=(
-            "¡Bienvenido che! I'm your Argentinian Spanish translator. "
-            "Send me a message in English or Spanish, and I'll translate it "
-            "to casual Argentinian Spanish."
-        )
-    ).send()
+    await cl.Message(content=WELCOME_MESSAGE).send()
     logger.info("Chat session started.")
 
 
 @cl.on_message
 async def on_message(message: cl.Message):
     """Handle incoming text messages and provide translations."""
+    # --- Empty Message Check ---
+    # Bail out before any other work so empty sends don't consume rate quota
+    if not (message.content or "").strip():
+        logger.warning("Received empty message.")
+        return
+
     # --- Rate Limit Check ---
     session_id = get_session_id()
-    if not message_limit_strategy.hit(message_rate_limit, session_id):
+    if ENABLE_RATE_LIMIT and not hit_message_rate_limit(session_id):
         # Limit exceeded
-        logger.warning(f"Rate limit exceeded for session {session_id}")
-        await cl.ErrorMessage(
-            content="Rate limit exceeded (5 messages per minute). Please wait a moment."
-        ).send()
+        logger.warning("Rate limit exceeded for session %s", session_id)
+        await cl.ErrorMessage(content=RATE_LIMIT_MESSAGE).send()
         return
 
     # --- Memory Management ---
-    trim_message_history(session_id)
-
-    # Track this message in history
-    history = cl.user_session.get("message_history", [])
+    # Track this message in history. Session lookups are bound once and the
+    # same bounded deque is mutated in place for the assistant reply below.
+    user_session = cl.user_session
+    history = user_session.get("message_history")
+    if history is None:
+        history = new_message_history()
+        user_session.set("message_history", history)
     history.append({"role": "user", "content": message.content})
-    cl.user_session.set("message_history", history)
 
     try:
         # Basic validations
@@ -249,39 +362,28 @@ async def on_message(message: cl.Message):
         if not service:
             return
 
-        if not message.content:
-            logger.warning("Received empty message.")
-            return
-
-        # Setup for translation
-        callback_handler = None
-        if settings.DEBUG:
-            callback_handler = ChainlitCallbackHandler()
-            logger.info("Debug enabled: Added ChainlitCallbackHandler.")
+        # Setup for translation. The handler tracks the current step, so it
+        # is created per message, and only when debugging is enabled.
+        callback_handler = ChainlitCallbackHandler() if DEBUG else None
 
-        # Perform translation
-        translation_result = await perform_translation(
+        # Perform translation, streaming the result to the user
+        reply_content = await perform_translation(
             service, message.content, callback_handler
         )
 
-        # Send result
-        await cl.Message(content=f"Translation: {translation_result}").send()
-
         # Update history
-        history = cl.user_session.get("message_history", [])
-        history.append(
-            {"role": "assistant", "content": f"Translation: {translation_result}"}
-        )
-        cl.user_session.set("message_history", history)
+        history.append({"role": "assistant", "content": reply_content})
 
     except TranslationError as e:
         logger.error(
-            f"Translation failed for '{message.content[:50]}...': {e}", exc_info=False
+            "Translation failed for '%.50s...': %s", message.content, e, exc_info=False
         )
         await cl.ErrorMessage(content=f"Sorry, translation failed: {e}").send()
     except AppError as e:
         logger.error(
-            f"Service error during translation for '{message.content[:50]}...': {e}",
+            "Service error during translation for '%.50s...': %s",
+            message.content,
+            e,
             exc_info=True,
         )
         await cl.ErrorMessage(
@@ -289,7 +391,9 @@ async def on_message(message: cl.Message):
         ).send()
     except Exception as e:
         logger.error(
-            f"Unexpected error during translation for '{message.content[:50]}...': {e}",
+            "Unexpected error during translation for '%.50s...': %s",
+            message.content,
+            e,
             exc_info=True,
         )
         await cl.ErrorMessage(
@@ -308,16 +412,15 @@ async def on_chat_end():
         session_id = (
             cl.context.session.id if hasattr(cl.context, "session") else "unknown"
         )
-        logger.info(f"Cleaning up resources for ending session {session_id}")
+        logger.info("Cleaning up resources for ending session %s", session_id)
+
+        # Drop the session's rate-limit bucket to keep the dict bounded
+        _message_buckets.pop(session_id, None)
 
-        # Instead of clear(), reset specific keys we care about
-        if hasattr(cl, "user_session"):
-            # Get all keys in the session
-            keys = list(cl.user_session.keys())
-            # Remove each key individually
-            for key in keys:
-                cl.user_session.pop(key, None)
+        # Only remove the keys this app owns; Chainlit manages its own keys
+        for key in SESSION_KEYS:
+            cl.user_session.pop(key, None)
 
-            logger.info(f"Successfully cleaned up resources for session {session_id}")
+        logger.info("Successfully cleaned up resources for session %s", session_id)
     except Exception as e:
-        logger.error(f"Error during session cleanup: {e}", exc_info=True)
+        logger.error("Error during session cleanup: %s", e, exc_info=True)
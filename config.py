@@ -28,15 +28,54 @@ class Settings(BaseSettings):
     # New settings for VentureOut data
     VENTUREOUT_DATA_PATH: str = "data/ventureout_data.jsonl"
     USE_VENTUREOUT_DATA: bool = True
+    # Cleaned VentureOut posts are cached here across runs (empty disables)
+    CLEAN_TEXT_CACHE_PATH: str = "vector_index_cache/clean_text.json"
+    # Clean VentureOut posts in a process pool, one worker per CPU. Off by
+    # default: the bundled 209 posts clean serially in about 0.1 s, less than
+    # the pool takes to start, so it only pays off for much larger corpora.
+    CLEAN_TEXT_PARALLEL: bool = False
 
     # --- Vector Store Configuration ---
-    VECTORSTORE_TYPE: str = "CHROMA"  # Options: FAISS or CHROMA
-    # Chroma is set as default because:
-    # 1. Provides persistent storage by default, preserving embeddings between restarts
-    # 2. Better support for metadata filtering (by source, region, etc.)
-    # 3. Dataset size is moderate (phrases + VentureOut content < 1MB)
-    # 4. More user-friendly for development with automatic persistence
-    CHROMA_PERSIST_DIRECTORY: str = "chroma_db"
+    # Built indices are persisted here, one subdirectory per document fingerprint,
+    # so restarts with unchanged data skip re-computing embeddings
+    VECTOR_INDEX_CACHE_DIR: str = "vector_index_cache"
+    # Options: none (float32 in-memory store), flat (exact float32 FAISS index,
+    # faster search), fp16 (float16 FAISS index, ~2x less memory), sq8 (8-bit
+    # quantized FAISS index, ~4x less memory) or ivfpq (IVF-PQ FAISS index for
+    # large corpora: sub-linear search, much smaller, lower recall).
+    # FAISS search ignores the retriever's MMR mode.
+    VECTORSTORE_QUANTIZATION: str = "none"
+    # ivfpq only: corpora smaller than this use sq8, as IVF-PQ needs training data
+    FAISS_IVF_THRESHOLD: int = 10000
+    # ivfpq only: clusters scanned per query (higher = better recall, slower)
+    FAISS_NPROBE: int = 8
+    # ivfpq only: bytes per stored vector; must divide the embedding dimensions
+    FAISS_PQ_SUBQUANTIZERS: int = 32
+    # Memory-map persisted FAISS indices instead of reading them into RAM, so
+    # worker processes serving the same index share its pages
+    FAISS_MMAP: bool = True
+
+    # --- Embedding Configuration ---
+    EMBEDDING_PROVIDER: str = "openai"  # Options: openai or local
+    # Size of OpenAI embedding vectors (text-embedding-3-small supports up to
+    # 1536). Smaller vectors mean a smaller index and faster search.
+    EMBEDDING_DIMENSIONS: int = 512
+    # Used when EMBEDDING_PROVIDER is "local" (needs the local-embeddings extra).
+    # Runs on CPU with no network round-trips and produces 384-dim vectors.
+    LOCAL_EMBEDDING_MODEL_NAME: str = (
+        "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    )
+    # Embedding API requests kept in flight at once while building the index.
+    # Raise for higher OpenAI rate-limit tiers, lower if requests get throttled.
+    EMBEDDING_CONCURRENCY: int = 4
+    # Attempts per embedding request before giving up on rate-limit errors
+    EMBEDDING_MAX_RETRIES: int = 6
+    # Embeddings of individual texts are cached here, so rebuilding the index
+    # after a data change only embeds new or edited texts (empty disables)
+    EMBEDDING_CACHE_PATH: str = "vector_index_cache/embeddings.sqlite3"
+    # Reuse cached embeddings for texts that differ only in case, whitespace or
+    # trailing punctuation (fewer API calls while editing data, slightly stale)
+    EMBEDDING_FUZZY_CACHE: bool = False
 
     # --- Memory Management Configuration ---
     # Maximum number of documents to retrieve for context (smaller = less memory)
@@ -45,6 +84,8 @@ class Settings(BaseSettings):
     VECTORSTORE_BATCH_SIZE: int = 50
     # Maximum history length (in message pairs) for chat sessions
     MAX_HISTORY_LENGTH: int = 15
+    # Seconds between background samples of process memory (RSS)
+    MEMORY_SAMPLE_INTERVAL: float = 10.0
 
     # --- Prompt Configuration ---
     PROMPTS_DIR: str = "prompts"
@@ -54,12 +95,22 @@ class Settings(BaseSettings):
     # --- Translator Configuration ---
     TRANSLATOR_MODEL_NAME: str = "gpt-4o"
     TRANSLATOR_TEMPERATURE: float = 0.9
+    # Number of recent translations kept in memory (0 disables the cache)
+    TRANSLATION_CACHE_SIZE: int = 1024
+    # Seconds a cached translation is reused before it is generated again
+    TRANSLATION_CACHE_TTL: float = 3600.0
+    # Number of recent inputs whose retrieved reference phrases are kept
+    # (0 disables the cache)
+    RETRIEVAL_CACHE_SIZE: int = 1024
 
     # --- Language Detection Configuration ---
     SHORT_INPUT_WORD_THRESHOLD: int = 2  # Use LLM if word count <= this
     # Optional: Specify a different model just for detection if needed
     # LANGUAGE_DETECTION_MODEL_NAME: str | None = "gpt-3.5-turbo"
 
+    # --- Rate Limiting ---
+    ENABLE_RATE_LIMIT: bool = True  # Per-session chat message limiting
+
     # --- Logging ---
     LOG_LEVEL: str = "INFO"
 
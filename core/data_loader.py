@@ -29,21 +29,34 @@ Usage:
 """
 
 # Standard library imports
+import asyncio
+import functools
+import hashlib
+import json
 import logging
-from typing import List, Optional, Union
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 # Third-party library imports
-import pandas as pd
-from llama_index.core import VectorStoreIndex
-from llama_index.core.schema import Document
-from llama_index.embeddings.openai import OpenAIEmbedding
-from llama_index.vector_stores.chroma import ChromaVectorStore
-from llama_index.vector_stores.faiss import FaissVectorStore
+from llama_index.core import (
+    Settings,
+    StorageContext,
+    VectorStoreIndex,
+    load_index_from_storage,
+)
+from llama_index.core.embeddings import BaseEmbedding
+from llama_index.core.ingestion import run_transformations
+from llama_index.core.schema import BaseNode, Document, MetadataMode
 
 # Local application imports
 # Import the settings object
 from config import settings
 
+# Import the persistent embedding cache
+from .embedding_cache import EmbeddingCache
+
 # Import custom exception
 from .exceptions import DataLoaderError
 
@@ -54,170 +67,688 @@ from .ventureout_loader import (
     load_ventureout_data,
 )
 
-# Type alias for vector stores
-VectorStore = Union[FaissVectorStore, ChromaVectorStore]
+# pandas is only needed while loading the CSV, so it is imported lazily there
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Type alias for the vector index
 IndexType = VectorStoreIndex
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of built indices, keyed by debug_limit, so that repeated
+# calls (e.g. a re-imported app module) bind the existing index instead of
+# re-parsing the data and re-computing every embedding.
+_VECTOR_INDEX_CACHE: Dict[Optional[int], IndexType] = {}
+
+# Columns the phrases CSV must provide
+REQUIRED_CSV_COLUMNS = [
+    "Original Phrase/Word",
+    "Argentinian Equivalent",
+    "Explanation (Context/Usage)",
+    "Region Specificity",
+    "Level of Formality",
+]
+# All columns used to build phrase documents, in template unpacking order
+PHRASE_CSV_COLUMNS = [
+    "Original Phrase/Word",
+    "Argentinian Equivalent",
+    "Explanation (Context/Usage)",
+    "Region Specificity",
+    "Level of Formality",
+    "Example Sentence (Spanish)",
+    "Example Sentence (English)",
+    "Connotation",
+    "Register",
+]
+
+# Text layout of a phrase document, filled in once per CSV row
+PHRASE_DOCUMENT_TEMPLATE = (
+    "Original: {original}\n"
+    "Argentinian: {argentinian}\n"
+    "Context/Explanation: {context}\n"
+    "Region: {region}\n"
+    "Register: {register}\n"
+    "Connotation: {connotation}\n"
+    "Example (Spanish): {example_spanish}\n"
+    "Example (English): {example_english}\n"
+    "Formality: {formality}"
+)
+# Metadata keys of a phrase document. The text already spells out every
+# field, so metadata is kept out of the embedded and LLM text rather than
+# repeating it there; one shared list serves all phrase documents.
+PHRASE_METADATA_KEYS = [
+    "original",
+    "argentinian",
+    "context",
+    "region",
+    "formality",
+    "register",
+    "connotation",
+    "source",
+    "data_type",
+]
+
+
+def _pyarrow_available() -> bool:
+    """Returns True if pyarrow is installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _csv_engine() -> str:
+    """Returns the fastest available pandas CSV engine."""
+    # pyarrow is multithreaded and parses columns without building Python objects
+    return "pyarrow" if _pyarrow_available() else "c"
+
+
+def _validated_csv_cache_paths(file_path: str) -> Tuple[str, str]:
+    """Returns the Parquet and metadata paths caching a validated CSV."""
+    base = os.path.join(
+        settings.VECTOR_INDEX_CACHE_DIR,
+        "validated_csv",
+        os.path.basename(file_path) + ".validated",
+    )
+    return base + ".parquet", base + ".meta.json"
+
+
+def _validated_csv_cache_key(file_path: str) -> Dict[str, Any]:
+    """
+    Identifies a CSV file's contents and the schema it was validated against.
+
+    A changed modification time or size, or different expected columns,
+    invalidate the cached DataFrame.
+    """
+    stat = os.stat(file_path)
+    return {
+        "path": os.path.abspath(file_path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "columns": PHRASE_CSV_COLUMNS,
+        "required": REQUIRED_CSV_COLUMNS,
+    }
+
+
+def _read_validated_csv_cache(
+    file_path: str, cache_key: Dict[str, Any]
+) -> Optional["pd.DataFrame"]:
+    """
+    Returns the cached DataFrame for an unchanged, already validated CSV.
+
+    Returns:
+        The DataFrame, or None if there is no up-to-date cache.
+    """
+    import pandas as pd
+
+    parquet_path, meta_path = _validated_csv_cache_paths(file_path)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            if json.load(f) != cache_key:
+                return None
+        df = pd.read_parquet(parquet_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A corrupt cache is not fatal: parse the CSV instead
+        logger.warning("Ignoring unreadable CSV cache for %s: %s", file_path, e)
+        return None
+    logger.info("Loaded %d validated phrases from %s", len(df), parquet_path)
+    return df
+
+
+def _write_validated_csv_cache(
+    df: "pd.DataFrame", file_path: str, cache_key: Dict[str, Any]
+) -> None:
+    """Caches a validated DataFrame as Parquet so later starts skip the CSV."""
+    parquet_path, meta_path = _validated_csv_cache_paths(file_path)
+    try:
+        os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+        df.to_parquet(parquet_path, index=False)
+        # Written last, so an interrupted write never validates a stale file
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(cache_key, f)
+    except Exception as e:
+        # Caching is an optimization only; the parsed DataFrame is still valid
+        logger.warning("Failed to cache validated CSV %s: %s", file_path, e)
+
+
+def _read_phrase_csv(file_path: str, usecols: List[str]) -> "pd.DataFrame":
+    """Parses only the used columns of the CSV, with the fastest engine that can."""
+    import pandas as pd
+
+    if _csv_engine() == "pyarrow":
+        try:
+            return pd.read_csv(file_path, engine="pyarrow", usecols=usecols)
+        except ValueError as e:
+            # pyarrow rejects rows with missing trailing fields, which the C
+            # engine pads with empty cells
+            logger.info(
+                "pyarrow could not parse %s (%s); using the C engine", file_path, e
+            )
+    return pd.read_csv(file_path, engine="c", usecols=usecols)
 
-def _load_data_from_csv(file_path: str) -> pd.DataFrame:
+
+def _normalize_csv_cells(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Renders every cell as the string phrase documents are built from.
+
+    The CSV engines disagree on missing cells (NaN with the C engine, None
+    with pyarrow, which astype(str) would render as "None"), so all missing
+    cells become "nan", as NaN has always rendered in document text.
+    """
+    return df.astype(object).where(df.notna(), "nan").astype(str)
+
+
+def _load_data_from_csv(file_path: str) -> "pd.DataFrame":
     """Loads data from the specified CSV file into a pandas DataFrame."""
+    import pandas as pd
+
     try:
-        df = pd.read_csv(file_path)
-        logger.info(f"Loaded {len(df)} phrases from {file_path}")
+        # Parquet caching needs pyarrow; without it the CSV is parsed each time
+        cache_key = None
+        if _pyarrow_available():
+            cache_key = _validated_csv_cache_key(file_path)
+            df = _read_validated_csv_cache(file_path, cache_key)
+            if df is not None:
+                return df
+
+        # Read the header only, so that usecols can be given as the list of
+        # column names the pyarrow engine requires, even if some are missing
+        header = pd.read_csv(file_path, nrows=0).columns
+        usecols = [col for col in PHRASE_CSV_COLUMNS if col in header]
+        df = _normalize_csv_cells(_read_phrase_csv(file_path, usecols))
+        logger.info("Loaded %d phrases from %s", len(df), file_path)
         # Ensure required columns exist
-        required_cols = [
-            "Original Phrase/Word",
-            "Argentinian Equivalent",
-            "Explanation (Context/Usage)",
-            "Region Specificity",
-            "Level of Formality",
-        ]
-        if not all(col in df.columns for col in required_cols):
-            missing = [col for col in required_cols if col not in df.columns]
+        if not all(col in df.columns for col in REQUIRED_CSV_COLUMNS):
+            missing = [col for col in REQUIRED_CSV_COLUMNS if col not in df.columns]
             # Raise specific error
             raise DataLoaderError(f"CSV missing required columns: {missing}")
+        if cache_key is not None:
+            # The cells are already normalized to the strings documents embed,
+            # so cached and freshly parsed runs build identical documents
+            _write_validated_csv_cache(df, file_path, cache_key)
         return df
     except FileNotFoundError:
-        logger.error(f"Error: CSV file not found at {file_path}")
+        logger.error("Error: CSV file not found at %s", file_path)
         # Raise specific error
         raise DataLoaderError(f"CSV file not found at {file_path}") from None
     except ValueError as e:
         # Catch potential value errors from validation and wrap them
-        logger.error(f"Data validation error in CSV {file_path}: {e}")
+        logger.error("Data validation error in CSV %s: %s", file_path, e)
         raise DataLoaderError(f"Data validation error in CSV: {e}") from e
     except Exception as e:
         logger.error(
-            f"Error loading or validating CSV from {file_path}: {e}", exc_info=True
+            "Error loading or validating CSV from %s: %s", file_path, e, exc_info=True
         )
         # Raise specific error, chaining the original exception
         raise DataLoaderError(f"Failed to load or validate CSV: {e}") from e
 
 
-def _create_documents_from_dataframe(df: pd.DataFrame) -> List[Document]:
+def _create_documents_from_dataframe(df: "pd.DataFrame") -> List[Document]:
     """Converts DataFrame rows into LlamaIndex Document objects."""
     documents = []
-    # Define expected columns for clarity
-    expected_cols = [
-        "Original Phrase/Word",
-        "Argentinian Equivalent",
-        "Explanation (Context/Usage)",
-        "Region Specificity",
-        "Level of Formality",
-        "Example Sentence (Spanish)",
-        "Example Sentence (English)",
-        "Connotation",
-        "Register",
-    ]
+    expected_cols = PHRASE_CSV_COLUMNS
     # Check if expected columns exist in the DataFrame after enrichment
     if not all(col in df.columns for col in expected_cols):
         missing = [col for col in expected_cols if col not in df.columns]
         logger.error(
-            f"Enriched DataFrame is missing expected columns: {missing}. "
-            f"Cannot create documents."
+            "Enriched DataFrame is missing expected columns: %s. "
+            "Cannot create documents.",
+            missing,
         )
         # Raise specific error
         raise DataLoaderError(
             f"Enriched DataFrame is missing expected columns: {missing}"
         )
 
-    for index, row in df.iterrows():
+    # Convert all columns to strings in one vectorized pass, then iterate over
+    # plain tuples (in expected_cols order) instead of boxing rows as Series
+    rows = df[expected_cols].astype(str).itertuples(index=False, name=None)
+    for (
+        original,
+        argentinian,
+        context,
+        region,
+        formality,
+        example_spanish,
+        example_english,
+        connotation,
+        register,
+    ) in rows:
         # Include enriched fields in the page_content
-        # Use .get() with defaults for robustness against missing data
-        # (though checked above)
-        content = f"""
-        Original: {row.get("Original Phrase/Word", "")}
-        Argentinian: {row.get("Argentinian Equivalent", "")}
-        Context/Explanation: {row.get("Explanation (Context/Usage)", "")}
-        Region: {row.get("Region Specificity", "Unknown")}
-        Register: {row.get("Register", "Unknown")}
-        Connotation: {row.get("Connotation", "Unknown")}
-        Example (Spanish): {row.get("Example Sentence (Spanish)", "")}
-        Example (English): {row.get("Example Sentence (English)", "")}
-        Formality: {row.get("Level of Formality", "Unknown")} # Keep original?
-        """
+        content = PHRASE_DOCUMENT_TEMPLATE.format(
+            original=original,
+            argentinian=argentinian,
+            context=context,
+            region=region,
+            register=register,
+            connotation=connotation,
+            example_spanish=example_spanish,
+            example_english=example_english,
+            formality=formality,
+        )
+        # All metadata values are strings for vector store compatibility
         metadata = {
-            "original": str(row.get("Original Phrase/Word", "")),
-            "argentinian": str(row.get("Argentinian Equivalent", "")),
-            "context": str(row.get("Explanation (Context/Usage)", "")),
-            "region": str(row.get("Region Specificity", "Unknown")),
-            "formality": str(row.get("Level of Formality", "Unknown")),
+            "original": original,
+            "argentinian": argentinian,
+            "context": context,
+            "region": region,
+            "formality": formality,
             # Add new fields to metadata as well for potential filtering later
-            "register": str(row.get("Register", "Unknown")),
-            "connotation": str(row.get("Connotation", "Unknown")),
+            "register": register,
+            "connotation": connotation,
             "source": "phrases_csv",  # Add source to identify origin
             "data_type": "phrase",  # Add type for potential filtering
         }
-        # Ensure all metadata values are strings for vector store compatibility
-        doc = Document(text=content.strip(), metadata=metadata)
+        doc = Document(
+            text=content,
+            metadata=metadata,
+            excluded_embed_metadata_keys=PHRASE_METADATA_KEYS,
+            excluded_llm_metadata_keys=PHRASE_METADATA_KEYS,
+        )
         documents.append(doc)
-    logger.info(f"Created {len(documents)} documents from CSV DataFrame.")
+    logger.info("Created %d documents from CSV DataFrame.", len(documents))
     return documents
 
 
-def _create_vector_index(documents: List[Document], api_key: str) -> IndexType:
-    """Creates a vector index from documents using OpenAI embeddings."""
-    if not documents:
-        logger.error("No documents provided to create vector index.")
-        raise DataLoaderError("Cannot create vector index with empty documents list.")
+# File FaissVectorStore persists the FAISS index to, inside the persist dir
+FAISS_PERSIST_FNAME = "default__vector_store.json"
+
+# OpenAI embedding model used for the vector index
+EMBEDDING_MODEL_NAME = "text-embedding-3-small"
+
+
+def _create_local_embed_model() -> BaseEmbedding:
+    """
+    Creates a local sentence-transformers embedding model.
+
+    Requires the optional llama-index-embeddings-huggingface package
+    (install with the 'local-embeddings' extra).
+
+    Raises:
+        DataLoaderError: If the HuggingFace embeddings package is not installed.
+    """
     try:
-        import time
-
-        # Initialize embedding model with API key and more conservative settings
-        embed_model = OpenAIEmbedding(
-            api_key=api_key,
-            embed_batch_size=10,  # Smaller batches for rate limits
-            retry_on_throttling=True,
-            model="text-embedding-3-small",  # Small embedding model
-            additional_kwargs={
-                "dimensions": 1536  # Default embedding dimensions
-            },
+        from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+    except ImportError as e:
+        raise DataLoaderError(
+            "EMBEDDING_PROVIDER is 'local' but llama-index-embeddings-huggingface "
+            "is not installed. Install the 'local-embeddings' extra."
+        ) from e
+    logger.info("Using local embedding model: %s", settings.LOCAL_EMBEDDING_MODEL_NAME)
+    return HuggingFaceEmbedding(
+        model_name=settings.LOCAL_EMBEDDING_MODEL_NAME,
+        embed_batch_size=settings.VECTORSTORE_BATCH_SIZE,
+        num_workers=settings.EMBEDDING_CONCURRENCY,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _create_embed_model(api_key: str) -> BaseEmbedding:
+    """
+    Creates the embedding model used to build and query the index.
+
+    Uses OpenAI by default, or a local model when EMBEDDING_PROVIDER is 'local'.
+    The model is created once per process and shared by every index, so a
+    local model's weights are only loaded once.
+    """
+    provider = settings.EMBEDDING_PROVIDER.lower()
+    if provider == "local":
+        return _create_local_embed_model()
+    if provider != "openai":
+        raise DataLoaderError(
+            f"Unsupported EMBEDDING_PROVIDER: {settings.EMBEDDING_PROVIDER}"
         )
 
-        # Process documents in smaller batches to avoid rate limits
-        logger.info(
-            f"Processing {len(documents)} documents in batches to avoid rate limits"
+    from llama_index.embeddings.openai import OpenAIEmbedding
+
+    # Initialize embedding model with API key, batching and throttling retries
+    return OpenAIEmbedding(
+        api_key=api_key,
+        embed_batch_size=settings.VECTORSTORE_BATCH_SIZE,  # Docs per API request
+        num_workers=settings.EMBEDDING_CONCURRENCY,  # Concurrent batch requests
+        # Throttled (429) requests are retried by the OpenAI client with
+        # jittered exponential backoff, honoring the Retry-After header
+        max_retries=settings.EMBEDDING_MAX_RETRIES,
+        retry_on_throttling=True,
+        model=EMBEDDING_MODEL_NAME,  # Small embedding model
+        additional_kwargs={
+            # Truncated output; text-embedding-3 models keep most of their
+            # retrieval quality with far fewer dimensions
+            "dimensions": settings.EMBEDDING_DIMENSIONS
+        },
+    )
+
+
+def _embed_model_id(embed_model: BaseEmbedding) -> str:
+    """Identifies the embedding model and the size of the vectors it returns."""
+    model_id = f"{type(embed_model).__name__}:{embed_model.model_name}"
+    if settings.EMBEDDING_PROVIDER.lower() == "openai":
+        model_id += f":{settings.EMBEDDING_DIMENSIONS}"
+    return model_id
+
+
+def _compute_documents_fingerprint(
+    documents: List[Document], embed_model: BaseEmbedding
+) -> str:
+    """
+    Computes a stable fingerprint of the documents and index settings.
+
+    The fingerprint changes whenever any document text or metadata changes,
+    or a different embedding model, quantization or IVF-PQ layout
+    (FAISS_IVF_THRESHOLD, FAISS_PQ_SUBQUANTIZERS) is used, so a persisted
+    index is only reused when it was built from identical input. FAISS_NPROBE
+    is left out, as it is applied again whenever an index is loaded.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    quantization = settings.VECTORSTORE_QUANTIZATION.lower()
+    index_id = f"{_embed_model_id(embed_model)}:{quantization}"
+    if quantization == "ivfpq":
+        index_id += (
+            f":{settings.FAISS_IVF_THRESHOLD}:{settings.FAISS_PQ_SUBQUANTIZERS}"
         )
-        batch_size = 20
-        all_indices = []
+    hasher.update(index_id.encode("utf-8"))
+    for doc in documents:
+        # Hash exactly what gets embedded, plus the full metadata
+        hasher.update(doc.get_content(metadata_mode=MetadataMode.EMBED).encode("utf-8"))
+        hasher.update(repr(sorted(doc.metadata.items())).encode("utf-8"))
+    return hasher.hexdigest()
 
-        for i in range(0, len(documents), batch_size):
-            batch_end = min(i + batch_size, len(documents))
-            logger.info(
-                f"Processing batch {i//batch_size + 1}: documents {i} to {batch_end}"
+
+def _load_persisted_index(
+    persist_dir: str, embed_model: BaseEmbedding
+) -> Optional[IndexType]:
+    """
+    Loads a previously persisted vector index, if one exists.
+
+    Returns:
+        The loaded index, or None if nothing usable is persisted.
+    """
+    if not os.path.isdir(persist_dir):
+        return None
+    try:
+        if _use_faiss_index():
+            from llama_index.vector_stores.faiss import FaissVectorStore
+
+            vector_store = FaissVectorStore(
+                faiss_index=_read_faiss_index(
+                    os.path.join(persist_dir, FAISS_PERSIST_FNAME)
+                )
+            )
+            _set_faiss_nprobe(vector_store.client)
+            storage_context = StorageContext.from_defaults(
+                vector_store=vector_store, persist_dir=persist_dir
             )
+        else:
+            storage_context = StorageContext.from_defaults(persist_dir=persist_dir)
+        index = load_index_from_storage(storage_context, embed_model=embed_model)
+        logger.info("Loaded persisted vector index from %s", persist_dir)
+        return index
+    except Exception as e:
+        # A corrupt or incompatible cache is not fatal: rebuild instead
+        logger.warning(
+            "Failed to load persisted vector index from %s: %s. Rebuilding.",
+            persist_dir,
+            e,
+        )
+        return None
 
-            # Create an index for this batch
-            batch_documents = documents[i:batch_end]
 
-            # Add delay between batches to avoid rate limiting
-            if i > 0:
-                logger.info("Waiting 10 seconds to avoid rate limits...")
-                time.sleep(10)
+def _persist_index(index: IndexType, persist_dir: str) -> None:
+    """Persists the vector index to disk so later starts can skip embedding."""
+    try:
+        index.storage_context.persist(persist_dir=persist_dir)
+        logger.info("Persisted vector index to %s", persist_dir)
+    except Exception as e:
+        # Persisting is an optimization only; the in-memory index is still valid
+        logger.warning("Failed to persist vector index to %s: %s", persist_dir, e)
+
+
+def _use_faiss_index() -> bool:
+    """Returns True if the index should use a FAISS store."""
+    quantization = settings.VECTORSTORE_QUANTIZATION.lower()
+    if quantization not in ("none", "flat", "fp16", "sq8", "ivfpq"):
+        raise DataLoaderError(
+            f"Unsupported VECTORSTORE_QUANTIZATION: {settings.VECTORSTORE_QUANTIZATION}"
+        )
+    return quantization != "none"
+
+
+def _read_faiss_index(path: str):
+    """
+    Reads a persisted FAISS index, memory-mapped if FAISS_MMAP is enabled.
+
+    A memory-mapped index is paged in from the file on demand, and the pages
+    are shared by every process that maps the same file, instead of each
+    process holding its own copy. FAISS reads index types it cannot map
+    into memory as usual.
+    """
+    import faiss
+
+    if settings.FAISS_MMAP:
+        return faiss.read_index(path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    return faiss.read_index(path)
+
+
+def _set_faiss_nprobe(faiss_index) -> None:
+    """Applies FAISS_NPROBE to an IVF index; other index types are left as is."""
+    import faiss
+
+    ivf_index = faiss.try_extract_index_ivf(faiss_index)
+    if ivf_index is not None:
+        ivf_index.nprobe = settings.FAISS_NPROBE
+
+
+def _open_embedding_cache(embed_model: BaseEmbedding) -> Optional[EmbeddingCache]:
+    """
+    Opens the on-disk embedding cache for the given model, if enabled.
+
+    Returns:
+        The cache, or None if caching is disabled or the cache is unusable.
+    """
+    if not settings.EMBEDDING_CACHE_PATH:
+        return None
+    try:
+        return EmbeddingCache(
+            settings.EMBEDDING_CACHE_PATH,
+            _embed_model_id(embed_model),
+            normalize=settings.EMBEDDING_FUZZY_CACHE,
+        )
+    except Exception as e:
+        # Caching is an optimization only; embed everything instead
+        logger.warning(
+            "Failed to open embedding cache at %s: %s",
+            settings.EMBEDDING_CACHE_PATH,
+            e,
+        )
+        return None
+
+
+def _embed_texts(texts: List[str], embed_model: BaseEmbedding) -> List[List[float]]:
+    """
+    Embeds texts, sending each distinct text to the embedding model only once.
+
+    Duplicate texts (e.g. repeated CSV rows or blog paragraphs) share the
+    embedding of their first occurrence.
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    if len(unique_texts) < len(texts):
+        logger.info(
+            "Deduped %d/%d texts before embedding",
+            len(texts) - len(unique_texts),
+            len(texts),
+        )
+    embeddings = dict(zip(unique_texts, _embed_unique_texts(unique_texts, embed_model)))
+    return [embeddings[text] for text in texts]
+
+
+def _embed_unique_texts(
+    texts: List[str], embed_model: BaseEmbedding
+) -> List[List[float]]:
+    """
+    Embeds texts, reusing cached embeddings and caching any new ones.
+
+    Only texts missing from the cache are sent to the embedding model.
+    """
+    cache = _open_embedding_cache(embed_model)
+    if cache is None:
+        return asyncio.run(
+            embed_model.aget_text_embedding_batch(texts, show_progress=True)
+        )
 
-            # Create the index for this batch
-            batch_index = VectorStoreIndex.from_documents(
-                documents=batch_documents, embed_model=embed_model, show_progress=True
+    try:
+        embeddings = cache.get_many(texts)
+        missing = [i for i in range(len(texts)) if i not in embeddings]
+        logger.info(
+            "Reusing %d cached embeddings, embedding %d new texts",
+            len(embeddings),
+            len(missing),
+        )
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            new_embeddings = asyncio.run(
+                embed_model.aget_text_embedding_batch(missing_texts, show_progress=True)
             )
+            embeddings.update(zip(missing, new_embeddings))
+            cache.put_many(missing_texts, new_embeddings)
+        return [embeddings[i] for i in range(len(texts))]
+    finally:
+        cache.close()
 
-            all_indices.append(batch_index)
 
-            logger.info(f"Completed batch {i//batch_size + 1}")
+def _embed_documents(
+    documents: List[Document], embed_model: BaseEmbedding
+) -> List[BaseNode]:
+    """
+    Splits documents into nodes and embeds them with concurrent API requests.
 
-        # If we processed in batches, use the first index
-        # Normally we'd want to merge them, but for now this is simpler
-        if all_indices:
-            logger.info(
-                f"Successfully created vector index with {len(all_indices)} batches"
+    Batches of embed_batch_size texts are sent concurrently, with at most
+    embed_model.num_workers requests in flight, instead of one after another.
+    This runs in a worker thread during startup, so it owns its event loop.
+
+    Returns:
+        The nodes, each with its embedding set.
+    """
+    # Split documents into nodes exactly as from_documents would
+    nodes = run_transformations(documents, Settings.transformations)
+    texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+    embeddings = _embed_texts(texts, embed_model)
+    for node, embedding in zip(nodes, embeddings):
+        node.embedding = embedding
+    return nodes
+
+
+def _create_trained_faiss_index(vectors):
+    """
+    Creates and trains the FAISS index for the given vectors.
+
+    Flat keeps exact float32 vectors and scans them all with FAISS's SIMD
+    inner product, without LlamaIndex's per-query Python similarity loop.
+    FP16 stores each vector component in two bytes instead of four, halving
+    index memory with negligible loss in ranking. SQ8 uses one byte, cutting
+    memory by ~4x. Both still scan every vector per query. IVF-PQ
+    (VECTORSTORE_QUANTIZATION=ivfpq) only scans the FAISS_NPROBE clusters
+    nearest the query and stores each vector in FAISS_PQ_SUBQUANTIZERS bytes,
+    trading some recall for much faster search and a far smaller index. It
+    needs enough vectors to train, so smaller corpora fall back to SQ8.
+    """
+    import faiss
+
+    count, dimensions = vectors.shape
+    # Vectors are unit length, so inner product ranks like cosine
+    if settings.VECTORSTORE_QUANTIZATION.lower() == "flat":
+        return faiss.IndexFlatIP(dimensions)
+    if settings.VECTORSTORE_QUANTIZATION.lower() == "ivfpq":
+        if count >= settings.FAISS_IVF_THRESHOLD:
+            nlist = max(1, int(math.sqrt(count)))
+            faiss_index = faiss.index_factory(
+                dimensions,
+                f"IVF{nlist},PQ{settings.FAISS_PQ_SUBQUANTIZERS}",
+                faiss.METRIC_INNER_PRODUCT,
             )
-            return all_indices[0]
+            faiss_index.train(vectors)
+            _set_faiss_nprobe(faiss_index)
+            logger.info("Built IVF-PQ index with %d clusters", nlist)
+            return faiss_index
+        logger.info(
+            "Only %d vectors (IVF threshold %d), using an SQ8 index instead",
+            count,
+            settings.FAISS_IVF_THRESHOLD,
+        )
+
+    # Only stored vectors are quantized; queries are still compared in float32
+    if settings.VECTORSTORE_QUANTIZATION.lower() == "fp16":
+        quantizer_type = faiss.ScalarQuantizer.QT_fp16
+    else:
+        quantizer_type = faiss.ScalarQuantizer.QT_8bit
+    faiss_index = faiss.IndexScalarQuantizer(
+        dimensions, quantizer_type, faiss.METRIC_INNER_PRODUCT
+    )
+    faiss_index.train(vectors)
+    return faiss_index
+
+
+def _create_faiss_vector_index(
+    nodes: List[BaseNode], embed_model: BaseEmbedding
+) -> IndexType:
+    """
+    Creates a vector index backed by a FAISS index.
+
+    Quantizers must be trained on the vectors before they are added, so
+    it takes nodes that are already embedded.
+    """
+    import faiss
+    import numpy as np
+    from llama_index.vector_stores.faiss import FaissVectorStore
+
+    # L2-normalize all vectors in one vectorized pass, so that inner product
+    # equals cosine similarity whatever the embedding model returns
+    vectors = np.asarray([node.embedding for node in nodes], dtype="float32")
+    faiss.normalize_L2(vectors)
+    for node, vector in zip(nodes, vectors):
+        node.embedding = vector.tolist()
+    faiss_index = _create_trained_faiss_index(vectors)
+
+    storage_context = StorageContext.from_defaults(
+        vector_store=FaissVectorStore(faiss_index=faiss_index)
+    )
+    # Nodes already carry embeddings, so the index does not re-embed them
+    return VectorStoreIndex(
+        nodes=nodes, storage_context=storage_context, embed_model=embed_model
+    )
+
+
+def _create_vector_index(
+    documents: List[Document], embed_model: BaseEmbedding
+) -> IndexType:
+    """Creates a vector index from documents using OpenAI embeddings."""
+    if not documents:
+        logger.error("No documents provided to create vector index.")
+        raise DataLoaderError("Cannot create vector index with empty documents list.")
+    try:
+        # Build a single index over all documents. The embedding model sends
+        # documents to the API in batches of embed_batch_size, several batches
+        # at a time, and retries on throttling.
+        logger.info(
+            "Embedding %d documents in batches of %d (%d concurrent requests)",
+            len(documents),
+            embed_model.embed_batch_size,
+            embed_model.num_workers or 1,
+        )
+        nodes = _embed_documents(documents, embed_model)
+        if _use_faiss_index():
+            vector_index = _create_faiss_vector_index(nodes, embed_model)
         else:
-            logger.error("No indices were created")
-            raise DataLoaderError("Failed to create any vector indices")
+            # Nodes already carry embeddings, so the index does not re-embed them
+            vector_index = VectorStoreIndex(nodes=nodes, embed_model=embed_model)
+        logger.info("Successfully created vector index with %d docs", len(documents))
+        return vector_index
 
     except Exception as e:
-        logger.error(f"Failed to create vector index: {e}", exc_info=True)
+        logger.error("Failed to create vector index: %s", e, exc_info=True)
         # Raise specific error
         raise DataLoaderError(f"Failed to create vector index: {e}") from e
 
@@ -232,7 +763,7 @@ def _load_phrases_data() -> List[Document]:
     Raises:
         DataLoaderError: If loading or processing fails.
     """
-    logger.info(f"Loading phrases from {settings.PHRASES_CSV_PATH}...")
+    logger.info("Loading phrases from %s...", settings.PHRASES_CSV_PATH)
     df = _load_data_from_csv(settings.PHRASES_CSV_PATH)
     if df.empty:
         raise DataLoaderError(
@@ -245,7 +776,7 @@ def _load_phrases_data() -> List[Document]:
             "No documents were created from the CSV DataFrame. Cannot proceed."
         )
 
-    logger.info(f"Added {len(phrase_documents)} phrase documents to the collection.")
+    logger.info("Added %d phrase documents to the collection.", len(phrase_documents))
     return phrase_documents
 
 
@@ -262,14 +793,18 @@ def _load_ventureout_data() -> List[Document]:
     # Try to copy data from data_scripts to data directory if needed
     copy_ventureout_data_to_data_dir()
 
-    logger.info(f"Loading VentureOut data from {settings.VENTUREOUT_DATA_PATH}...")
+    logger.info("Loading VentureOut data from %s...", settings.VENTUREOUT_DATA_PATH)
     try:
-        ventureout_data = load_ventureout_data(settings.VENTUREOUT_DATA_PATH)
+        ventureout_data = load_ventureout_data(
+            settings.VENTUREOUT_DATA_PATH,
+            clean_cache_path=settings.CLEAN_TEXT_CACHE_PATH or None,
+            parallel=settings.CLEAN_TEXT_PARALLEL,
+        )
         ventureout_documents = create_ventureout_documents(ventureout_data)
 
         if ventureout_documents:
             logger.info(
-                f"Added {len(ventureout_documents)} VentureOut docs to the collection."
+                "Added %d VentureOut docs to the collection.", len(ventureout_documents)
             )
             return ventureout_documents
         else:
@@ -280,7 +815,7 @@ def _load_ventureout_data() -> List[Document]:
     except DataLoaderError as e:
         # Log but continue with phrases only
         logger.warning(
-            f"Failed to load VentureOut data: {e}. " f"Continuing with phrases only."
+            "Failed to load VentureOut data: %s. Continuing with phrases only.", e
         )
         return []
 
@@ -299,7 +834,7 @@ def _apply_debug_limit(
         List of Document objects, limited to debug_limit if specified.
     """
     if debug_limit is not None and len(documents) > debug_limit:
-        logger.info(f"Limiting documents to {debug_limit} for debugging")
+        logger.info("Limiting documents to %d for debugging", debug_limit)
         return documents[:debug_limit]
     return documents
 
@@ -309,6 +844,9 @@ def load_vector_store_and_data(debug_limit: int = None) -> IndexType:
     Loads data from configured sources, creates Documents, builds a vector index,
     and returns the index.
 
+    The index is built once per process and cached; subsequent calls with the
+    same debug_limit return the cached instance.
+
     Args:
         debug_limit: Optional limit on the number of documents to load for debugging
 
@@ -322,38 +860,60 @@ def load_vector_store_and_data(debug_limit: int = None) -> IndexType:
     Raises:
         DataLoaderError: If any step in the loading or processing fails.
     """
+    cached_index = _VECTOR_INDEX_CACHE.get(debug_limit)
+    if cached_index is not None:
+        logger.info("Reusing cached vector index.")
+        return cached_index
+
     logger.info("Starting data loading process...")
 
     try:
-        # 1. Load phrase documents (required)
-        all_documents = _load_phrases_data()
+        if settings.USE_VENTUREOUT_DATA and debug_limit is None:
+            # 1-2. Both sources are needed, and they are independent, so load
+            # VentureOut data in a worker thread while the phrases load here
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                ventureout_future = executor.submit(_load_ventureout_data)
+                all_documents = _load_phrases_data()
+                all_documents.extend(ventureout_future.result())
+        else:
+            # 1. Load phrase documents (required)
+            all_documents = _load_phrases_data()
 
-        # 2. Load VentureOut data if enabled and we have space for it
-        has_debug_space = len(all_documents) < debug_limit if debug_limit else True
-        if settings.USE_VENTUREOUT_DATA and has_debug_space:
-            ventureout_docs = _load_ventureout_data()
+            # 2. Load VentureOut data if enabled and we have space for it
+            has_debug_space = len(all_documents) < debug_limit if debug_limit else True
+            if settings.USE_VENTUREOUT_DATA and has_debug_space:
+                ventureout_docs = _load_ventureout_data()
 
-            # Only add VentureOut docs up to the debug limit
-            if debug_limit is not None and ventureout_docs:
-                remaining = max(0, debug_limit - len(all_documents))
-                if remaining < len(ventureout_docs):
-                    logger.info(
-                        f"Limiting VentureOut docs to {remaining} (debug_limit)"
-                    )
-                    ventureout_docs = ventureout_docs[:remaining]
+                # Only add VentureOut docs up to the debug limit
+                if debug_limit is not None and ventureout_docs:
+                    remaining = max(0, debug_limit - len(all_documents))
+                    if remaining < len(ventureout_docs):
+                        logger.info(
+                            "Limiting VentureOut docs to %d (debug_limit)", remaining
+                        )
+                        ventureout_docs = ventureout_docs[:remaining]
 
-            all_documents.extend(ventureout_docs)
+                all_documents.extend(ventureout_docs)
 
         # 3. Apply debug limit to all documents
         all_documents = _apply_debug_limit(all_documents, debug_limit)
 
-        # 4. Create vector index from all documents
-        logger.info(
-            f"Creating vector index with {len(all_documents)} total documents..."
-        )
-        vector_index = _create_vector_index(all_documents, settings.OPENAI_API_KEY)
+        # 4. Reuse a persisted index built from identical documents, if any
+        embed_model = _create_embed_model(settings.OPENAI_API_KEY)
+        fingerprint = _compute_documents_fingerprint(all_documents, embed_model)
+        persist_dir = os.path.join(settings.VECTOR_INDEX_CACHE_DIR, fingerprint)
+        vector_index = _load_persisted_index(persist_dir, embed_model)
+
+        # 5. Otherwise create the vector index from all documents and persist it
+        if vector_index is None:
+            logger.info(
+                "Creating vector index with %d total documents...", len(all_documents)
+            )
+            vector_index = _create_vector_index(all_documents, embed_model)
+            _persist_index(vector_index, persist_dir)
 
         logger.info("Data loading and vector index creation complete.")
+        _VECTOR_INDEX_CACHE[debug_limit] = vector_index
         return vector_index
 
     except DataLoaderError:  # Re-raise specific errors
@@ -0,0 +1,121 @@
+"""
+Persistent Embedding Cache Module for Argentine Spanish Learning RAG System
+
+Stores document embeddings on disk, keyed by a hash of the embedding model
+and the exact text that was embedded, so rebuilding the vector index after
+a data change only pays for the texts that are actually new or edited.
+
+Usage:
+    from core.embedding_cache import EmbeddingCache
+
+    cache = EmbeddingCache("vector_index_cache/embeddings.sqlite3", "model-id")
+    cached = cache.get_many(texts)  # {index: embedding} for cache hits
+    cache.put_many(new_texts, new_embeddings)
+"""
+
+# Standard library imports
+import array
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+from typing import Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Vectors are stored as float32, half the size of the float64 values the
+# embedding APIs return. A cached vector is a float32 round-trip of the fresh
+# one: equal to about 7 significant digits but not bit-identical, so scores
+# from cached and fresh vectors can only disagree on near-ties.
+VECTOR_TYPECODE = "f"
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_CHUNK_SIZE = 500
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+TRAILING_PUNCTUATION_PATTERN = re.compile(r"[.,;:!?…]+$")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizes text for cache lookups.
+
+    Lower-cases, collapses whitespace and drops trailing punctuation, so
+    cosmetic edits map to the same key.
+    """
+    text = WHITESPACE_PATTERN.sub(" ", text.lower()).strip()
+    return TRAILING_PUNCTUATION_PATTERN.sub("", text).rstrip()
+
+
+class EmbeddingCache:
+    """A content-addressed on-disk store of text embeddings."""
+
+    def __init__(self, path: str, model_id: str, normalize: bool = False):
+        """
+        Opens (or creates) the cache database.
+
+        Args:
+            path: Path to the SQLite database file.
+            model_id: Identifies the embedding model; vectors from different
+                models never share keys.
+            normalize: Key entries by normalized text, so that texts differing
+                only in case, whitespace or trailing punctuation share one
+                embedding.
+        """
+        self.path = path
+        self.model_id = model_id
+        self.normalize = normalize
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+        )
+
+    def _key(self, text: str) -> str:
+        """Returns the cache key for a text embedded with this model."""
+        if self.normalize:
+            # Prefixed so normalized and exact keys never collide
+            text = "norm\0" + normalize_text(text)
+        return hashlib.sha256(f"{self.model_id}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> Dict[int, List[float]]:
+        """
+        Looks up cached embeddings.
+
+        Args:
+            texts: The texts to look up.
+
+        Returns:
+            A mapping from position in texts to embedding, for cache hits only.
+            Embeddings come back as float32-rounded values (see VECTOR_TYPECODE).
+        """
+        keys = [self._key(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        for start in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+            chunk = keys[start : start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for key, blob in rows:
+                found[key] = array.array(VECTOR_TYPECODE, blob).tolist()
+        return {i: found[key] for i, key in enumerate(keys) if key in found}
+
+    def put_many(self, texts: Sequence[str], embeddings: Sequence[List[float]]) -> None:
+        """Stores embeddings for the given texts, replacing existing entries."""
+        rows = [
+            (self._key(text), array.array(VECTOR_TYPECODE, embedding).tobytes())
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+            )
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        self._connection.close()
@@ -6,6 +6,7 @@ specified in the application's configuration.
 """
 
 import logging
+from functools import cached_property
 from pathlib import Path
 
 # Import configuration constants
@@ -25,39 +26,19 @@ class PromptManager:
     def __init__(self):
         """
         Initialize the prompt manager using the directory specified in the config.
+
+        Prompt files are read on first access rather than here, so prompts
+        that are never used are never read.
         """
         self.prompts_dir = Path(settings.PROMPTS_DIR)
-        self._ensure_prompts_dir_exists()
         logger.info(
-            f"PromptManager initialized. Using prompt directory: {self.prompts_dir}"
+            "PromptManager initialized. Using prompt directory: %s", self.prompts_dir
         )
-        # Load prompts on initialization to fail fast if they are missing
-        try:
-            self._system_prompt = self._load_prompt(settings.SYSTEM_PROMPT_FILE)
-            self._translation_prompt = self._load_prompt(
-                settings.TRANSLATION_PROMPT_FILE
-            )
-            logger.info("Successfully loaded system and translation prompts.")
-        except FileNotFoundError as e:
-            logger.error(f"Failed to initialize PromptManager: {e}", exc_info=True)
-            # Wrap in custom exception
-            raise PromptError(f"Missing required prompt file: {e}") from e
-        except IOError as e:
-            logger.error(
-                f"Failed to initialize PromptManager due to IO error: {e}",
-                exc_info=True,
-            )
-            raise PromptError(f"IO error loading prompt file: {e}") from e
-        except Exception as e:  # Catch any other unexpected errors
-            logger.error(
-                f"Unexpected error initializing PromptManager: {e}", exc_info=True
-            )
-            raise PromptError(f"Unexpected error initializing prompts: {e}") from e
 
     def _ensure_prompts_dir_exists(self):
         """Checks if the prompts directory exists."""
         if not self.prompts_dir.is_dir():
-            logger.error(f"Prompt directory not found: {self.prompts_dir}")
+            logger.error("Prompt directory not found: %s", self.prompts_dir)
             # Raise specific error
             raise PromptError(f"Prompt directory not found: {self.prompts_dir}")
 
@@ -74,36 +55,40 @@ class PromptManager:
         Raises:
             PromptError: If the file is not found or cannot be read.
         """
+        self._ensure_prompts_dir_exists()
         file_path = self.prompts_dir / filename
-        logger.debug(f"Attempting to load prompt from: {file_path}")
+        logger.debug("Attempting to load prompt from: %s", file_path)
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read().strip()
                 if not content:
-                    logger.warning(f"Prompt file '{filename}' is empty.")
+                    logger.warning("Prompt file '%s' is empty.", filename)
                 return content
         except FileNotFoundError:
-            logger.error(f"Prompt file not found: {file_path}")
+            logger.error("Prompt file not found: %s", file_path)
             # Raise specific error
             raise PromptError(f"Prompt file not found: {file_path}") from None
         except IOError as e:
-            logger.error(f"Error reading prompt file {file_path}: {e}")
+            logger.error("Error reading prompt file %s: %s", file_path, e)
             # Raise specific error
             raise PromptError(f"Error reading prompt file {file_path}: {e}") from e
         except Exception as e:
             logger.error(
-                f"Unexpected error reading prompt file {file_path}: {e}", exc_info=True
+                "Unexpected error reading prompt file %s: %s",
+                file_path,
+                e,
+                exc_info=True,
             )
             raise PromptError(
                 f"Unexpected error reading prompt file {file_path}: {e}"
             ) from e
 
-    @property
+    @cached_property
     def system_prompt(self) -> str:
-        """Returns the loaded system prompt."""
-        return self._system_prompt
+        """Returns the system prompt, loading it on first access."""
+        return self._load_prompt(settings.SYSTEM_PROMPT_FILE)
 
-    @property
+    @cached_property
     def translation_prompt(self) -> str:
-        """Returns the loaded translation prompt template."""
-        return self._translation_prompt
+        """Returns the translation prompt template, loading it on first access."""
+        return self._load_prompt(settings.TRANSLATION_PROMPT_FILE)
@@ -5,23 +5,92 @@ This module defines the ArgentinianTranslator class, responsible for the core
 translation logic using a LlamaIndex RAG (Retrieval-Augmented Generation) system.
 """
 
+import functools
 import logging
 import re
-from typing import List, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple
 
-from llama_index.core import VectorStoreIndex
 from llama_index.core.prompts import PromptTemplate
-from llama_index.core.query_engine import RetrieverQueryEngine
-from llama_index.core.schema import NodeWithScore
-from llama_index.llms.openai import OpenAI
 
 from config import settings
 from core.prompt_manager import PromptManager
 
 from .exceptions import TranslationError
 
+# Only needed for annotations. The OpenAI LLM and the query engine pull in
+# large dependency trees, so they are imported where they are first used.
+if TYPE_CHECKING:
+    from llama_index.core import VectorStoreIndex
+    from llama_index.core.schema import NodeWithScore
+    from llama_index.llms.openai import OpenAI
+
 logger = logging.getLogger(__name__)
 
+# Statements attributing Malvinas/Falklands to Britain, merged into a single
+# pattern so the input is scanned once
+MALVINAS_PATTERNS = [
+    # Match variations of "Falklands are British/English"
+    r"\b(?:the\s+)?Falklands?\s+(?:islands?\s+)?(?:is|are|belongs?(?:\s+to)?)\s+(?:British|English|UK|Britain)",
+    # Match variations of "Malvinas are British/English"
+    r"\b(?:the\s+)?Malvinas\s+(?:islands?\s+)?(?:is|are|belongs?(?:\s+to)?)\s+(?:British|English|UK|Britain)",
+    # Match "British/English Falklands/Malvinas"
+    r"\b(?:British|English|UK|Britain)(?:\'s)?\s+(?:Falklands?|Malvinas)",
+]
+MALVINAS_PATTERN = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in MALVINAS_PATTERNS), re.IGNORECASE
+)
+MALVINAS_REPLACEMENT = "Las Malvinas son argentinas"
+# Every pattern above needs one of these words, so text without them is skipped
+MALVINAS_TRIGGER_WORDS = ("malvinas", "falkland")
+
+# Placeholders filled into the translation prompt
+PROMPT_FIELD_PATTERN = re.compile(r"\{(reference_phrases|text)\}")
+
+
+def preprocess_malvinas_statements(text: str) -> str:
+    """
+    Preprocesses the input text to enforce 'Las Malvinas son argentinas' whenever
+    Malvinas/Falklands are mentioned with British/English ownership.
+
+    Args:
+        text: The input text to preprocess
+
+    Returns:
+        The preprocessed text with any Malvinas/Falklands statements modified
+    """
+    # Most inputs never mention the islands, so skip the regex for those
+    folded_text = text.casefold()
+    if not any(word in folded_text for word in MALVINAS_TRIGGER_WORDS):
+        return text
+
+    modified_text, replacements = MALVINAS_PATTERN.subn(MALVINAS_REPLACEMENT, text)
+
+    # Log if we made a replacement
+    if replacements:
+        logger.info(
+            "Replaced Malvinas/Falklands statement with 'Las Malvinas son argentinas'"
+        )
+
+    return modified_text
+
+
+def _split_prompt_template(template: str) -> Tuple[str, ...]:
+    """
+    Splits a prompt template at its placeholders.
+
+    Returns:
+        Literal text and placeholder names, alternating, starting and ending
+        with (possibly empty) literal text
+    """
+    return tuple(PROMPT_FIELD_PATTERN.split(template))
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_prompt(template: str) -> PromptTemplate:
+    """Parses a prompt template once per distinct template string."""
+    return PromptTemplate(template=template)
+
 
 class ArgentinianTranslator:
     """
@@ -34,9 +103,9 @@ class ArgentinianTranslator:
 
     def __init__(
         self,
-        vector_index: VectorStoreIndex,
+        vector_index: "VectorStoreIndex",
         prompt_manager: PromptManager,
-        llm: Optional[OpenAI] = None,
+        llm: Optional["OpenAI"] = None,
     ):
         """
         Initialize the translator.
@@ -53,7 +122,9 @@ class ArgentinianTranslator:
         if llm:
             self.llm = llm
         else:
-            logger.info(f"Initializing OpenAI model: {settings.TRANSLATOR_MODEL_NAME}")
+            from llama_index.llms.openai import OpenAI
+
+            logger.info("Initializing OpenAI model: %s", settings.TRANSLATOR_MODEL_NAME)
             self.llm = OpenAI(
                 model=settings.TRANSLATOR_MODEL_NAME,
                 api_key=settings.OPENAI_API_KEY,
@@ -62,61 +133,23 @@ class ArgentinianTranslator:
 
         # Create retriever with configured number of documents to limit memory usage
         self.retriever = self._create_retriever(k=settings.MAX_RETRIEVAL_DOCS)
-        self.query_engine = self._build_query_engine()
+        # LRU cache of formatted reference phrases per (normalized) query, so
+        # repeated inputs skip the query embedding call and the index search
+        self._reference_cache: OrderedDict[str, str] = OrderedDict()
+        self._reference_cache_size = settings.RETRIEVAL_CACHE_SIZE
+        # Only the prompt template is loaded up front, so a missing or broken
+        # template still fails at startup. translate() builds its prompt and
+        # calls the LLM directly, so the query engine is built on first access.
+        self._load_translation_prompt_template()
+        # Split once, so building a prompt only joins the pieces
+        self._prompt_segments = _split_prompt_template(
+            self.prompt_manager.translation_prompt
+        )
         logger.info("ArgentinianTranslator initialized successfully.")
 
-    def _preprocess_malvinas_statements(self, text: str) -> str:
-        """
-        Preprocesses the input text to enforce 'Las Malvinas son argentinas' whenever
-        Malvinas/Falklands are mentioned with British/English ownership.
-
-        Args:
-            text: The input text to preprocess
-
-        Returns:
-            The preprocessed text with any Malvinas/Falklands statements modified
-        """
-        # Define patterns to match various Malvinas/Falklands statements
-        patterns = [
-            # Match variations of "Falklands are British/English"
-            r"\b(?:the\s+)?Falklands?\s+(?:islands?\s+)?(?:is|are|belongs?(?:\s+to)?)\s+(?:British|English|UK|Britain)",
-            # Match variations of "Malvinas are British/English"
-            r"\b(?:the\s+)?Malvinas\s+(?:islands?\s+)?(?:is|are|belongs?(?:\s+to)?)\s+(?:British|English|UK|Britain)",
-            # Match "British/English Falklands/Malvinas"
-            r"\b(?:British|English|UK|Britain)(?:\'s)?\s+(?:Falklands?|Malvinas)",
-        ]
-
-        # Replacement phrases (we'll randomly choose one for variety)
-        replacements = [
-            "Las Malvinas son argentinas",
-            "Las Malvinas siempre fueron y serán argentinas",
-            "Las Islas Malvinas pertenecen a Argentina",
-        ]
-
-        # Function to determine replacement
-        def replace_match(match):
-            # Always use the Spanish version
-            return replacements[0]
-
-        # Apply substitutions for each pattern
-        modified_text = text
-        for pattern in patterns:
-            modified_text = re.sub(
-                pattern, replace_match, modified_text, flags=re.IGNORECASE
-            )
-
-        # Log if we made a replacement
-        if modified_text != text:
-            logger.info(
-                "Replaced Malvinas/Falklands statement with "
-                "'Las Malvinas son argentinas'"
-            )
-
-        return modified_text
-
     def _create_retriever(self, k: int = 3):
         """Creates a retriever from the vector index."""
-        logger.debug(f"Creating retriever with k={k}")
+        logger.debug("Creating retriever with k=%d", k)
         # Add memory management for retrieval
         return self.vector_index.as_retriever(
             similarity_top_k=k,
@@ -124,24 +157,48 @@ class ArgentinianTranslator:
             mmr_threshold=0.8,  # Controls diversity (higher = more diversity)
         )
 
-    def _format_retrieved_docs(self, nodes: List[NodeWithScore]) -> str:
+    def _format_retrieved_docs(self, nodes: List["NodeWithScore"]) -> str:
         """Formats retrieved nodes into a string for the prompt context."""
         if not nodes:
             return "No specific Argentinian expressions found as reference."
+        # Sorted so the same set of nodes always yields the same prompt bytes,
+        # whatever their ranking, which keeps the LLM's prompt cache warm
+        texts = sorted([node.node.text.strip() for node in nodes])
         # Using a clear separator for readability in the prompt
-        return "\n---\n".join([node.node.text.strip() for node in nodes])
+        return "\n---\n".join(texts)
 
-    def _build_query_engine(self):
-        """Builds the LlamaIndex Query Engine."""
-        logger.debug("Building query engine...")
+    async def _retrieve_reference_phrases(self, text: str) -> str:
+        """
+        Retrieves and formats the reference phrases for the text.
+
+        Results are cached per whitespace- and case-normalized text, as the
+        index does not change while the translator is alive.
+        """
+        key = " ".join(text.split()).lower()
+        reference_phrases = self._reference_cache.get(key)
+        if reference_phrases is not None:
+            self._reference_cache.move_to_end(key)
+            logger.debug("Reusing cached reference phrases.")
+            return reference_phrases
+
+        # The async retriever awaits the query embedding request instead of
+        # blocking the event loop, so other chat sessions keep being served
+        retrieval_results = await self.retriever.aretrieve(text)
+        reference_phrases = self._format_retrieved_docs(retrieval_results)
+        if self._reference_cache_size > 0:
+            self._reference_cache[key] = reference_phrases
+            if len(self._reference_cache) > self._reference_cache_size:
+                self._reference_cache.popitem(last=False)
+        return reference_phrases
+
+    def _load_translation_prompt_template(self) -> PromptTemplate:
+        """Loads the translation prompt template from the PromptManager."""
         try:
             # Load translation prompt template from the PromptManager
             translation_prompt_text = self.prompt_manager.translation_prompt
 
-            # Create a LlamaIndex PromptTemplate
-            translation_prompt_template = PromptTemplate(
-                template=translation_prompt_text
-            )
+            # Create (or reuse) a LlamaIndex PromptTemplate
+            translation_prompt_template = _compile_prompt(translation_prompt_text)
             logger.debug("Loaded translation prompt template.")
         except AttributeError:
             logger.error("Failed to load translation_prompt from PromptManager.")
@@ -150,14 +207,27 @@ class ArgentinianTranslator:
                 "Translation prompt template not found in PromptManager."
             )
         except Exception as e:
-            logger.error(f"Error loading prompt template: {e}", exc_info=True)
+            logger.error("Error loading prompt template: %s", e, exc_info=True)
             # Raise specific error
             raise TranslationError(
                 f"Failed to load translation prompt template: {e}"
             ) from e
+        return translation_prompt_template
+
+    @functools.cached_property
+    def query_engine(self):
+        """The LlamaIndex query engine, built on first access."""
+        return self._build_query_engine()
+
+    def _build_query_engine(self):
+        """Builds the LlamaIndex Query Engine."""
+        logger.debug("Building query engine...")
+        translation_prompt_template = self._load_translation_prompt_template()
 
         # Query Engine Definition
         try:
+            from llama_index.core.query_engine import RetrieverQueryEngine
+
             # Configure the query engine with our retriever and LLM
             query_engine = RetrieverQueryEngine.from_args(
                 retriever=self.retriever,
@@ -167,12 +237,31 @@ class ArgentinianTranslator:
                 response_mode="compact",  # Standard LlamaIndex mode
             )
         except Exception as e:
-            logger.error(f"Error building the query engine: {e}", exc_info=True)
+            logger.error("Error building the query engine: %s", e, exc_info=True)
             raise TranslationError(f"Failed to build query engine: {e}") from e
 
         logger.info("Query engine built successfully.")
         return query_engine
 
+    async def _build_translation_prompt(self, input_text: str) -> str:
+        """
+        Builds the full LLM prompt for the input text.
+
+        Preprocesses the text, retrieves reference phrases from the vector index
+        and fills them into the translation prompt template.
+        """
+        # Preprocess input for Malvinas mentions
+        preprocessed_text = preprocess_malvinas_statements(input_text)
+
+        # Retrieve relevant context from the vector index
+        reference_phrases = await self._retrieve_reference_phrases(preprocessed_text)
+
+        # Fill the reference phrases and input text into the template
+        fields = {"reference_phrases": reference_phrases, "text": preprocessed_text}
+        segments = list(self._prompt_segments)
+        segments[1::2] = [fields[name] for name in segments[1::2]]
+        return "".join(segments)
+
     async def translate(self, input_text: str) -> str:
         """
         Translate input text to Argentinian Spanish using the RAG query engine.
@@ -190,22 +279,9 @@ class ArgentinianTranslator:
             logger.warning("Translate called with empty input text.")
             return ""
 
-        logger.info(f"Translating text: '{input_text[:50]}...'")
+        logger.info("Translating text: '%.50s...'", input_text)
         try:
-            # Preprocess input for Malvinas mentions
-            preprocessed_text = self._preprocess_malvinas_statements(input_text)
-
-            # Retrieve relevant context from the vector index
-            retrieval_results = self.retriever.retrieve(preprocessed_text)
-            reference_phrases = self._format_retrieved_docs(retrieval_results)
-
-            # Load the prompt template
-            translation_prompt_text = self.prompt_manager.translation_prompt
-
-            # Format the prompt with reference phrases and input text
-            formatted_prompt = translation_prompt_text.replace(
-                "{reference_phrases}", reference_phrases
-            ).replace("{text}", preprocessed_text)
+            formatted_prompt = await self._build_translation_prompt(input_text)
 
             # Query the LLM directly
             response = await self.llm.acomplete(formatted_prompt)
@@ -213,6 +289,46 @@ class ArgentinianTranslator:
             logger.info("Translation successful.")
             return response.text.strip()
         except Exception as e:
-            logger.error(f"Error during translation query: {e}", exc_info=True)
+            logger.error("Error during translation query: %s", e, exc_info=True)
+            # Raise specific error
+            raise TranslationError(f"Translation failed: {e}") from e
+
+    async def translate_stream(self, input_text: str) -> AsyncIterator[str]:
+        """
+        Translate input text, yielding the translation as it is generated.
+
+        Args:
+            input_text: The text to translate.
+
+        Yields:
+            Chunks of the translated text. Leading whitespace is dropped, so
+            joining the chunks matches translate() up to trailing whitespace.
+
+        Raises:
+            TranslationError: If the translation fails.
+        """
+        if not input_text:
+            logger.warning("Translate called with empty input text.")
+            return
+
+        logger.info("Streaming translation for text: '%.50s...'", input_text)
+        try:
+            formatted_prompt = await self._build_translation_prompt(input_text)
+
+            # Stream the completion from the LLM
+            response_stream = await self.llm.astream_complete(formatted_prompt)
+            started = False
+            async for response in response_stream:
+                delta = response.delta or ""
+                if not started:
+                    delta = delta.lstrip()
+                    if not delta:
+                        continue
+                    started = True
+                yield delta
+
+            logger.info("Translation successful.")
+        except Exception as e:
+            logger.error("Error during translation query: %s", e, exc_info=True)
             # Raise specific error
             raise TranslationError(f"Translation failed: {e}") from e
@@ -31,27 +31,69 @@ Usage:
 import json
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # Third-party library imports
 from llama_index.core.schema import Document
 
+# orjson is a transitive dependency (see requirements.txt) and parses JSON
+# several times faster; fall back to the standard library without it
+try:
+    import orjson as json_parser
+except ImportError:
+    json_parser = json
+
 # Local application imports
 # Import custom exception
 from .exceptions import DataLoaderError
 
 # Import text utilities
-from .text_utils import clean_text
+from .text_utils import CleanTextCache, clean_texts
 
 logger = logging.getLogger(__name__)
 
 
-def load_ventureout_data(file_path: str) -> List[Dict[str, Any]]:
+def _parse_ventureout_lines(lines: Iterable[bytes]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse JSONL lines into post dictionaries.
+
+    Args:
+        lines: Raw (undecoded) lines of a VentureOut JSONL file
+
+    Returns:
+        The parsed posts, and the number of lines skipped as invalid
+    """
+    docs = []
+    skipped_count = 0
+    for line in lines:
+        if line.strip():
+            try:
+                # Both parsers accept UTF-8 bytes, so lines are never decoded
+                doc = json_parser.loads(line)
+                if "text" not in doc:
+                    raise KeyError("text")
+                docs.append(doc)
+            except json.JSONDecodeError as e:
+                logger.error(f"Error parsing JSON: {e}")
+                skipped_count += 1
+            except KeyError as e:
+                preview = line[:100].decode("utf-8", errors="replace")
+                logger.error(f"Missing key {e} in JSONL line: {preview}")
+                skipped_count += 1
+    return docs, skipped_count
+
+
+def load_ventureout_data(
+    file_path: str, clean_cache_path: Optional[str] = None, parallel: bool = False
+) -> List[Dict[str, Any]]:
     """
     Load data from JSONL file and apply cleaning.
 
     Args:
         file_path: Path to the JSONL file with VentureOut data
+        clean_cache_path: Optional path of a CleanTextCache file, so that
+            posts cleaned in a previous run are not cleaned again
+        parallel: Clean the posts in a process pool (see clean_texts)
 
     Returns:
         List of dictionaries containing cleaned data
@@ -61,41 +103,47 @@ def load_ventureout_data(file_path: str) -> List[Dict[str, Any]]:
     """
     logger.info(f"Loading and cleaning VentureOut data from {file_path}")
     documents = []
-    processed_count = 0
-    skipped_count = 0
+    clean_cache = CleanTextCache(clean_cache_path) if clean_cache_path else None
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        doc = json.loads(line)
-                        cleaned_text = clean_text(doc["text"], min_content_length=100)
-
-                        # Skip documents with minimal content
-                        # (function returns placeholder for short content)
-                        if cleaned_text == "No usable content found.":
-                            logger.debug(
-                                f"Skipping document with minimal content: {doc['url']}"
-                            )
-                            skipped_count += 1
-                            continue
-
-                        # Add cleaned text and source info
-                        doc["cleaned_text"] = cleaned_text
-                        documents.append(doc)
-                        processed_count += 1
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing JSON: {e}")
-                        skipped_count += 1
-                    except KeyError as e:
-                        logger.error(f"Missing key {e} in JSONL line: {line[:100]}")
-                        skipped_count += 1
+        # Parse everything first, so the posts can be cleaned as one batch
+        with open(file_path, "rb") as f:
+            raw_docs, skipped_count = _parse_ventureout_lines(f)
+
+        texts = [doc["text"] for doc in raw_docs]
+        if clean_cache:
+            cleaned_texts = clean_cache.clean_many(
+                texts, min_content_length=100, parallel=parallel
+            )
+        else:
+            cleaned_texts = clean_texts(
+                texts, min_content_length=100, parallel=parallel
+            )
+
+        for doc, cleaned_text in zip(raw_docs, cleaned_texts):
+            # Skip documents with minimal content
+            # (function returns placeholder for short content)
+            if cleaned_text == "No usable content found.":
+                logger.debug(
+                    f"Skipping document with minimal content: {doc.get('url')}"
+                )
+                skipped_count += 1
+                continue
+
+            # Add cleaned text and source info
+            doc["cleaned_text"] = cleaned_text
+            documents.append(doc)
 
         logger.info(
-            f"Loaded and cleaned {processed_count} documents from {file_path}. "
+            f"Loaded and cleaned {len(documents)} documents from {file_path}. "
             f"Skipped {skipped_count}."
         )
+        if clean_cache:
+            try:
+                clean_cache.save()
+            except OSError as e:
+                # Caching is an optimization only; the cleaned data is valid
+                logger.warning(f"Failed to save clean_text cache: {e}")
         return documents
     except FileNotFoundError:
         logger.error(f"VentureOut data file not found at {file_path}")
@@ -7,18 +7,23 @@ It initializes and holds the core ArgentinianTranslator instance.
 
 import logging
 import re  # For language code validation
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Tuple
 
 from langdetect import LangDetectException, detect
 from langdetect.detector_factory import DetectorFactory
-from llama_index.core import VectorStoreIndex
 from llama_index.core.prompts import PromptTemplate
-from llama_index.llms.openai import OpenAI
 
 from config import settings  # Import settings
 from core.exceptions import AppError, TranslationError
 from core.prompt_manager import PromptManager
 from core.translator import ArgentinianTranslator
 
+if TYPE_CHECKING:
+    from llama_index.core import VectorStoreIndex
+
 logger = logging.getLogger(__name__)
 
 # --- Constants ---
@@ -26,6 +31,14 @@ SUPPORTED_LANGS = ["en", "es"]
 UNKNOWN_LANG_CODE = "unknown"  # Standardize unknown code
 # Simple pattern for 2-letter ISO codes
 ISO_639_1_PATTERN = re.compile(r"^[a-z]{2}$")
+# Input with no letters at all (punctuation, digits, emoji) has nothing to translate
+NO_LETTERS_PATTERN = re.compile(r"^[\W\d_]+$")
+# Unambiguous Rioplatense words; Spanish input using them is already Argentinian
+ARGENTINIAN_MARKERS_PATTERN = re.compile(
+    r"\b(?:che|vos|boludos?|boludas?|laburo|laburar|quilombo|bondi|pibes?|pibas?"
+    r"|chab[oó]n|guita|morfar|fiaca)\b",
+    re.IGNORECASE,
+)
 
 # --- Language Detection Prompt Template (Keep it minimal) ---
 # LlamaIndex prompt template for language detection
@@ -51,7 +64,7 @@ except NameError:
 class TranslationService:
     """Orchestrates translation using the ArgentinianTranslator."""
 
-    def __init__(self, vector_index: VectorStoreIndex, prompt_manager: PromptManager):
+    def __init__(self, vector_index: "VectorStoreIndex", prompt_manager: PromptManager):
         """
         Initializes the TranslationService.
         Args:
@@ -69,7 +82,10 @@ class TranslationService:
             vector_index=vector_index, prompt_manager=prompt_manager
         )
 
-        # Create the language detection LLM
+        # Create the language detection LLM (imported here, like the
+        # translator's, to keep the OpenAI SDK off the import path)
+        from llama_index.llms.openai import OpenAI
+
         self.lang_detect_llm = OpenAI(
             model=settings.TRANSLATOR_MODEL_NAME,
             api_key=settings.OPENAI_API_KEY,
@@ -77,8 +93,44 @@ class TranslationService:
         )
         logger.info("LLM language detection initialized.")
 
+        # LRU cache of recent translations, keyed by normalized input text.
+        # The service is shared across sessions, so the cache is too.
+        # Entries are (expiry time, translation); expired entries are dropped
+        # on lookup so that translations are refreshed periodically.
+        self._translation_cache: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._translation_cache_size = settings.TRANSLATION_CACHE_SIZE
+        self._translation_cache_ttl = settings.TRANSLATION_CACHE_TTL
+
         logger.info("TranslationService initialized successfully.")
 
+    @staticmethod
+    def _normalize_cache_key(text: str) -> str:
+        """Normalizes input text so trivially different messages share a key."""
+        text = unicodedata.normalize("NFKC", text)
+        return " ".join(text.split()).lower()
+
+    def _get_cached_translation(self, key: str) -> Optional[str]:
+        """Returns an unexpired cached translation and marks it as recently used."""
+        cached = self._translation_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, translation = cached
+        if time.monotonic() >= expires_at:
+            del self._translation_cache[key]
+            return None
+        self._translation_cache.move_to_end(key)
+        return translation
+
+    def _cache_translation(self, key: str, translation: str) -> None:
+        """Stores a translation, evicting the least recently used entry."""
+        if self._translation_cache_size <= 0:
+            return
+        expires_at = time.monotonic() + self._translation_cache_ttl
+        self._translation_cache[key] = (expires_at, translation)
+        self._translation_cache.move_to_end(key)
+        if len(self._translation_cache) > self._translation_cache_size:
+            self._translation_cache.popitem(last=False)
+
     async def _detect_language_statistical(self, text: str) -> str:
         """Detect language using langdetect (statistical)."""
         try:
@@ -194,27 +246,28 @@ class TranslationService:
 
         return detected_lang
 
-    async def translate_text(self, text: str) -> str:
+    async def _resolve_without_translation(self, text: str) -> Optional[str]:
         """
-        Detects the language of the text using a hybrid approach and translates
-        it if it's English or Spanish.
+        Checks whether the text can be answered without calling the translator.
+
+        This is the case for input with no letters (returned unchanged), for
+        unsupported languages (answered with a user-facing message), and for
+        Spanish that already uses Argentinian vocabulary (returned unchanged).
 
         Args:
-            text: The input text to translate.
+            text: The input text to check.
 
         Returns:
-            The translated text, or a message indicating the language is unsupported.
+            None if translation should proceed, otherwise the response to
+            return instead of a translation.
 
         Raises:
-            AppError: If an unexpected error occurs during detection or
-                      translation setup.
-            TranslationError: If the core translation fails.
+            AppError: If an unexpected error occurs during detection.
         """
-        logger.debug(f"TranslationService received request: '{text[:50]}...'")
-
-        if not text.strip():
-            logger.warning("Received empty or whitespace-only text.")
-            return "Please provide some text to translate."
+        # 0. Nothing to translate (no letters), skip detection and the LLM
+        if NO_LETTERS_PATTERN.match(text):
+            logger.info("Input has no letters. Returning it unchanged.")
+            return text.strip()
 
         # 1. Language Detection (Hybrid Approach)
         try:
@@ -244,17 +297,84 @@ class TranslationService:
                 f"Detected: {detected_lang}"
             )
 
-        # 3. Proceed with Translation if supported or unknown
+        # 3. Spanish that already uses Argentinian vocabulary needs no work
+        if detected_lang == "es" and ARGENTINIAN_MARKERS_PATTERN.search(text):
+            logger.info("Input is already Argentinian Spanish. Returning it unchanged.")
+            return text.strip()
+
+        # 4. Proceed with Translation if supported or unknown
         if detected_lang == UNKNOWN_LANG_CODE:
             logger.info("Language is unknown, proceeding with translation attempt.")
         else:
             logger.info(
                 f"Language '{detected_lang}' is supported, proceeding with translation."
             )
+        return None
+
+    async def translate_text(self, text: str) -> str:
+        """
+        Detects the language of the text using a hybrid approach and translates
+        it if it's English or Spanish.
+
+        Args:
+            text: The input text to translate.
 
+        Returns:
+            The translated text, or a message indicating the language is unsupported.
+
+        Raises:
+            AppError: If an unexpected error occurs during detection or
+                      translation setup.
+            TranslationError: If the core translation fails.
+        """
+        # Collects the stream, so both entry points share the cache, the
+        # pre-checks and the error handling
+        chunks = [chunk async for chunk in self.translate_text_stream(text)]
+        return "".join(chunks).strip()
+
+    async def translate_text_stream(self, text: str) -> AsyncIterator[str]:
+        """
+        Streaming variant of translate_text.
+
+        Cached translations and responses that need no translation are yielded
+        as a single chunk; otherwise the translation is yielded as the LLM produces
+        it and cached once complete.
+
+        Args:
+            text: The input text to translate.
+
+        Yields:
+            Chunks of the translated text (or of a user-facing message).
+
+        Raises:
+            AppError: If an unexpected error occurs during detection or
+                      translation setup.
+            TranslationError: If the core translation fails.
+        """
+        logger.debug(f"TranslationService received stream request: '{text[:50]}...'")
+
+        if not text.strip():
+            logger.warning("Received empty or whitespace-only text.")
+            yield "Please provide some text to translate."
+            return
+
+        cache_key = self._normalize_cache_key(text)
+        cached_translation = self._get_cached_translation(cache_key)
+        if cached_translation is not None:
+            logger.info("Returning cached translation.")
+            yield cached_translation
+            return
+
+        untranslated_response = await self._resolve_without_translation(text)
+        if untranslated_response is not None:
+            yield untranslated_response
+            return
+
+        chunks = []
         try:
-            translated_text = await self.translator.translate(text)
-            return translated_text
+            async for chunk in self.translator.translate_stream(text):
+                chunks.append(chunk)
+                yield chunk
         except TranslationError as e:
             logger.error(
                 f"TranslationService re-raising TranslationError: {e}", exc_info=False
@@ -269,3 +389,5 @@ class TranslationService:
             raise AppError(
                 "An unexpected error occurred during the translation process."
             ) from e
+
+        self._cache_translation(cache_key, "".join(chunks).strip())
@@ -0,0 +1,6 @@
+"""Shared pytest configuration."""
+
+import os
+
+# config.Settings requires an API key at import time; tests never call OpenAI
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
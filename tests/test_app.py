@@ -0,0 +1,99 @@
+"""Tests for the Chainlit app helpers."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("chainlit")
+
+import app  # noqa: E402
+from core.exceptions import TranslationError  # noqa: E402
+
+
+class FakeService:
+    """Streams one token, then fails like a dropped LLM connection."""
+
+    async def translate_text_stream(self, text):
+        yield "Hola"
+        raise TranslationError("connection lost")
+
+
+def test_failed_stream_removes_the_partial_reply():
+    reply = mock.Mock(
+        stream_token=mock.AsyncMock(), send=mock.AsyncMock(), remove=mock.AsyncMock()
+    )
+    with mock.patch.object(app.cl, "Message", return_value=reply):
+        with pytest.raises(TranslationError):
+            asyncio.run(app.perform_translation(FakeService(), "Hello"))
+
+    reply.stream_token.assert_awaited_once_with("Hola")
+    reply.remove.assert_awaited_once()
+    reply.send.assert_not_awaited()
+
+
+class FakeClock:
+    """A time.monotonic() replacement that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with (
+        mock.patch.object(app.time, "monotonic", clock),
+        mock.patch.dict(app._message_buckets, clear=True),
+    ):
+        yield clock
+
+
+def test_rate_limit_allows_a_burst_then_rejects(clock):
+    for _ in range(app.MESSAGE_RATE_LIMIT):
+        assert app.hit_message_rate_limit("session")
+    assert not app.hit_message_rate_limit("session")
+    # Other sessions have their own bucket
+    assert app.hit_message_rate_limit("other")
+
+
+def test_rate_limit_refills_evenly_over_the_window(clock):
+    for _ in range(app.MESSAGE_RATE_LIMIT):
+        app.hit_message_rate_limit("session")
+    seconds_per_token = app.MESSAGE_RATE_WINDOW_SECONDS / app.MESSAGE_RATE_LIMIT
+
+    clock.now += seconds_per_token / 2
+    assert not app.hit_message_rate_limit("session")
+    # Rejected attempts keep the partial token (the margin absorbs rounding)
+    clock.now += seconds_per_token / 2 + 1e-6
+    assert app.hit_message_rate_limit("session")
+    assert not app.hit_message_rate_limit("session")
+
+
+def test_rate_limit_refill_is_capped_at_the_burst_size(clock):
+    app.hit_message_rate_limit("session")
+    clock.now += app.MESSAGE_RATE_WINDOW_SECONDS * 10
+
+    for _ in range(app.MESSAGE_RATE_LIMIT):
+        assert app.hit_message_rate_limit("session")
+    assert not app.hit_message_rate_limit("session")
+
+
+def test_rate_limit_message_uses_the_configured_limit():
+    assert f"{app.MESSAGE_RATE_LIMIT} messages" in app.RATE_LIMIT_MESSAGE
+    assert f"{app.MESSAGE_RATE_WINDOW_SECONDS:g} seconds" in app.RATE_LIMIT_MESSAGE
+
+
+def test_memory_poller_starts_with_the_first_session_only(monkeypatch):
+    monkeypatch.setattr(app, "_memory_poller_started", False)
+    monkeypatch.setattr(app, "_initialization_task", None)
+    monkeypatch.setattr(app, "initialize_services", mock.Mock())
+    with mock.patch.object(app.threading, "Thread") as thread:
+        asyncio.run(app.ensure_initialized())
+        asyncio.run(app.ensure_initialized())
+
+    thread.assert_called_once()
+    thread.return_value.start.assert_called_once()
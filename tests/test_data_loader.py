@@ -0,0 +1,102 @@
+"""Tests for loading the phrases CSV into documents."""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from core import data_loader  # noqa: E402
+
+CSV_HEADER = ",".join(data_loader.PHRASE_CSV_COLUMNS)
+# Every row has all fields, some of them empty
+COMPLETE_ROWS = (
+    "Hello,Hola,,Nationwide,Neutral,Hola che.,Hi mate.,Neutral,Standard\n"
+    "Money,Plata,Colloquial,Nationwide,Casual,Dame plata.,Give me money.,,\n"
+)
+# The second row lacks its trailing fields, as in the bundled CSV
+RAGGED_ROWS = (
+    "Hello,Hola,,Nationwide,Neutral,Hola che.,Hi mate.,Neutral,Standard\n"
+    "Money,Plata,Colloquial,Nationwide,Casual,Dame plata.,Give me money.\n"
+)
+
+
+def _write_csv(tmp_path, rows):
+    path = tmp_path / "phrases.csv"
+    path.write_text(f"{CSV_HEADER}\n{rows}", encoding="utf-8")
+    return str(path)
+
+
+def _document_texts(file_path, engine):
+    """Loads the CSV with the given pandas engine, bypassing the Parquet cache."""
+    with (
+        mock.patch.object(data_loader, "_csv_engine", return_value=engine),
+        mock.patch.object(data_loader, "_pyarrow_available", return_value=False),
+    ):
+        df = data_loader._load_data_from_csv(file_path)
+    return [doc.text for doc in data_loader._create_documents_from_dataframe(df)]
+
+
+@pytest.mark.parametrize(
+    "rows", [COMPLETE_ROWS, RAGGED_ROWS], ids=["complete", "ragged"]
+)
+def test_empty_cells_render_as_nan(tmp_path, rows):
+    texts = _document_texts(_write_csv(tmp_path, rows), "c")
+    assert "Context/Explanation: nan" in texts[0]
+    assert "Connotation: nan" in texts[1]
+    assert "None" not in "".join(texts)
+
+
+@pytest.mark.parametrize(
+    "rows", [COMPLETE_ROWS, RAGGED_ROWS], ids=["complete", "ragged"]
+)
+def test_engines_build_identical_documents(tmp_path, rows):
+    pytest.importorskip("pyarrow")
+    file_path = _write_csv(tmp_path, rows)
+    assert _document_texts(file_path, "pyarrow") == _document_texts(file_path, "c")
+
+
+def test_parquet_cache_builds_identical_documents(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = _write_csv(tmp_path, COMPLETE_ROWS)
+    uncached = _document_texts(file_path, "c")
+
+    def load_texts():
+        df = data_loader._load_data_from_csv(file_path)
+        return [doc.text for doc in data_loader._create_documents_from_dataframe(df)]
+
+    cache_dir = str(tmp_path / "cache")
+    with mock.patch.object(data_loader.settings, "VECTOR_INDEX_CACHE_DIR", cache_dir):
+        # The first load parses the CSV and writes the cache
+        assert load_texts() == uncached
+        # The second one must be served from the cache alone
+        with mock.patch.object(
+            data_loader, "_read_phrase_csv", side_effect=AssertionError("parsed")
+        ):
+            assert load_texts() == uncached
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("VECTORSTORE_QUANTIZATION", "sq8"),
+        ("FAISS_IVF_THRESHOLD", 500),
+        ("FAISS_PQ_SUBQUANTIZERS", 16),
+    ],
+)
+def test_fingerprint_covers_the_ivfpq_layout(setting, value):
+    from llama_index.core import Document, MockEmbedding
+
+    documents = [Document(text="Hola che.")]
+    embed_model = MockEmbedding(embed_dim=8)
+
+    def fingerprint():
+        return data_loader._compute_documents_fingerprint(documents, embed_model)
+
+    with mock.patch.object(data_loader.settings, "VECTORSTORE_QUANTIZATION", "ivfpq"):
+        before = fingerprint()
+        with mock.patch.object(data_loader.settings, setting, value):
+            assert fingerprint() != before
+        # Search-time settings do not change the index itself
+        with mock.patch.object(data_loader.settings, "FAISS_NPROBE", 64):
+            assert fingerprint() == before
@@ -0,0 +1,80 @@
+"""Tests for the persistent embedding cache."""
+
+import array
+
+import pytest
+
+from core.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "embeddings.sqlite3")
+
+
+def _float32(vector):
+    return array.array("f", vector).tolist()
+
+
+def test_round_trip_hits_and_misses(cache_path):
+    cache = EmbeddingCache(cache_path, "model-a")
+    cache.put_many(["hola", "che"], [[0.1, 0.2], [0.3, 0.4]])
+
+    found = cache.get_many(["che", "boludo", "hola"])
+
+    assert sorted(found) == [0, 2]
+    assert found[0] == _float32([0.3, 0.4])
+    assert found[2] == _float32([0.1, 0.2])
+
+
+def test_vectors_are_float32_round_trips(cache_path):
+    vector = [0.123456789012345, -1e-9]
+    cache = EmbeddingCache(cache_path, "model-a")
+    cache.put_many(["hola"], [vector])
+
+    cached = cache.get_many(["hola"])[0]
+
+    assert cached == _float32(vector)
+    assert cached != vector
+    assert cached == pytest.approx(vector, rel=1e-7)
+
+
+def test_entries_persist_across_connections(cache_path):
+    cache = EmbeddingCache(cache_path, "model-a")
+    cache.put_many(["hola"], [[1.0]])
+    cache.close()
+
+    assert EmbeddingCache(cache_path, "model-a").get_many(["hola"]) == {0: [1.0]}
+
+
+def test_lookups_above_the_chunk_size(cache_path):
+    # More keys than one SQLite IN (...) lookup binds, hits on both sides
+    texts = [f"text {i}" for i in range(1203)]
+    cache = EmbeddingCache(cache_path, "model-a")
+    cache.put_many(texts[::2], [[float(i)] for i in range(0, len(texts), 2)])
+
+    found = cache.get_many(texts)
+
+    assert sorted(found) == list(range(0, len(texts), 2))
+    assert all(found[i] == [float(i)] for i in found)
+
+
+def test_models_do_not_share_entries(cache_path):
+    EmbeddingCache(cache_path, "model-a").put_many(["hola"], [[1.0]])
+    cache_b = EmbeddingCache(cache_path, "model-b")
+
+    assert cache_b.get_many(["hola"]) == {}
+
+    cache_b.put_many(["hola"], [[2.0]])
+    assert EmbeddingCache(cache_path, "model-a").get_many(["hola"]) == {0: [1.0]}
+    assert cache_b.get_many(["hola"]) == {0: [2.0]}
+
+
+def test_normalized_keys_are_separate_from_exact_ones(cache_path):
+    EmbeddingCache(cache_path, "model-a").put_many(["Hola, che."], [[1.0]])
+    fuzzy = EmbeddingCache(cache_path, "model-a", normalize=True)
+
+    assert fuzzy.get_many(["Hola, che."]) == {}
+
+    fuzzy.put_many(["Hola, che."], [[2.0]])
+    assert fuzzy.get_many(["  hola,   CHE"]) == {0: [2.0]}
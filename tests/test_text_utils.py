@@ -0,0 +1,149 @@
+"""Tests for text cleaning and the persistent clean_text cache."""
+
+import json
+import os
+import random
+import re
+
+import pytest
+
+from core import text_utils
+from core.text_utils import CleanTextCache, clean_text, clean_texts
+
+VENTUREOUT_DATA = os.path.join(
+    os.path.dirname(__file__), "..", "data", "ventureout_data.jsonl"
+)
+
+
+def _reference_clean_text(text: str, min_content_length: int = 10) -> str:
+    """The original, unoptimized clean_text, kept as the behavior to match."""
+    if not text:
+        return ""
+    for pattern in text_utils.PATTERNS_TO_REMOVE:
+        text = re.sub(pattern, "", text, flags=re.DOTALL | re.IGNORECASE)
+    for point in text_utils.SPLIT_POINTS:
+        if point in text:
+            text = text.split(point)[0]
+    filtered_lines = []
+    skip_mode = False
+    for line in text.splitlines():
+        if re.match(r"^\s*\(\d+\)\s*$", line):
+            skip_mode = True
+        if not skip_mode:
+            filtered_lines.append(line)
+        if skip_mode and len(line.strip()) > 30:
+            skip_mode = False
+    text = "\n".join(filtered_lines)
+    if not text or len(text.strip()) < min_content_length:
+        return "No usable content found."
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r"\s{2,}", " ", text)
+    text = re.sub(r"https?://\S+", "", text)
+    return text.strip()
+
+
+BODY = "Che, ¿cómo andás? Hoy vamos a hablar del lunfardo porteño y sus orígenes."
+REPRESENTATIVE_INPUTS = [
+    "",
+    "short",
+    BODY,
+    f"{BODY}\r\n\r\n\r\nMore text\rwith old Mac breaks and separators.",
+    f"{BODY} See https://example.com/post?id=1 and http://x.y for more.",
+    f"{BODY}\n\nLeave a Reply Cancel reply ... for the next time I comment.\nEnd",
+    f"{BODY}\nRelated Posts\nSomething else\nCategories\nMore",
+    f"{BODY}\nCategories\nArgentinian Spanish (12)\nSpanish Teaching (3)",
+    f"{BODY}\n(45)\nSlang\n(3)\nA long line that ends the category listing block\n"
+    "Kept after the block",
+    f"(45)\n{BODY}\nshort\n(7)",
+    f"{BODY}\n  (12)  \n\n   \nx\n(123456789012345678901234567890)\nKept line",
+    f"Post author: Ana Post published: May 1 Reading time: 3 min read {BODY}",
+    f"{BODY}\nComments (4)\nAbout the author blah View all posts\nTail text here.",
+    f"{BODY}    with     many      spaces\t\tand\ttabs",
+]
+
+
+@pytest.mark.parametrize("text", REPRESENTATIVE_INPUTS)
+@pytest.mark.parametrize("min_content_length", [10, 100])
+def test_clean_text_matches_reference(text, min_content_length):
+    assert clean_text(text, min_content_length) == _reference_clean_text(
+        text, min_content_length
+    )
+
+
+def test_clean_text_matches_reference_on_random_layouts():
+    fragments = [
+        BODY,
+        "(45)",
+        " (3) ",
+        "short",
+        "",
+        "   ",
+        "x" * 31,
+        "https://example.com/a",
+        "Categories",
+        "Post navigation",
+        "a (4) b",
+        "\r",
+    ]
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = "".join(
+            rng.choice(fragments) + rng.choice(["\n", "\r\n", "", " "])
+            for _ in range(rng.randint(1, 10))
+        )
+        assert clean_text(text) == _reference_clean_text(text), repr(text)
+
+
+@pytest.mark.skipif(
+    not os.path.exists(VENTUREOUT_DATA), reason="bundled data not available"
+)
+def test_clean_text_matches_reference_on_bundled_posts():
+    with open(VENTUREOUT_DATA, encoding="utf-8") as f:
+        texts = [json.loads(line)["text"] for line in f if line.strip()]
+    assert clean_texts(texts, 100) == [_reference_clean_text(t, 100) for t in texts]
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / "clean_text.json")
+    cache = CleanTextCache(path)
+    assert cache.clean(BODY, 10) == clean_text(BODY, 10)
+    cache.save()
+
+    reloaded = CleanTextCache(path)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(text_utils, "clean_text", pytest.fail)
+        assert reloaded.clean(BODY, 10) == clean_text(BODY, 10)
+        assert reloaded.clean_many([BODY], 10) == [clean_text(BODY, 10)]
+    # Only the cache file remains; the temporary file was renamed over it
+    assert os.listdir(tmp_path) == ["clean_text.json"]
+
+
+def test_cache_survives_a_truncated_file(tmp_path):
+    path = str(tmp_path / "clean_text.json")
+    cache = CleanTextCache(path)
+    cache.clean(BODY)
+    cache.save()
+    with open(path, "r+", encoding="utf-8") as f:
+        f.truncate(len(f.read()) // 2)
+
+    cache = CleanTextCache(path)
+    assert cache.clean(BODY) == clean_text(BODY)
+    cache.save()
+
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)) == 1
+    assert CleanTextCache(path).clean(BODY) == clean_text(BODY)
+
+
+def test_cache_drops_entries_not_used_since_loading(tmp_path):
+    path = str(tmp_path / "clean_text.json")
+    cache = CleanTextCache(path)
+    cache.clean_many([BODY, BODY + " más"])
+    cache.save()
+
+    cache = CleanTextCache(path)
+    cache.clean(BODY)
+    cache.save()
+
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)) == 1
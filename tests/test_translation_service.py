@@ -0,0 +1,150 @@
+"""Tests for TranslationService."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from core.exceptions import AppError, TranslationError
+from services import translation_service
+from services.translation_service import TranslationService
+
+
+class FakeTranslator:
+    """Streams a fixed translation in chunks, or raises the given error."""
+
+    def __init__(self, chunks=("Hola", " che"), error=None):
+        self.chunks = chunks
+        self.error = error
+        self.calls = 0
+
+    async def translate_stream(self, text):
+        self.calls += 1
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise self.error
+
+
+@pytest.fixture
+def service():
+    with mock.patch.object(translation_service, "ArgentinianTranslator"):
+        service = TranslationService(vector_index=object(), prompt_manager=object())
+    service.translator = FakeTranslator()
+    # Translate everything; language detection is not under test here
+    service._resolve_without_translation = mock.AsyncMock(return_value=None)
+    return service
+
+
+def _collect(service, text):
+    async def collect():
+        return [chunk async for chunk in service.translate_text_stream(text)]
+
+    return asyncio.run(collect())
+
+
+def test_translate_text_joins_the_stream(service):
+    assert _collect(service, "Hello mate") == ["Hola", " che"]
+    assert asyncio.run(service.translate_text("Hello mate")) == "Hola che"
+
+
+def test_translate_text_shares_the_stream_cache(service):
+    assert asyncio.run(service.translate_text("Hello mate")) == "Hola che"
+    assert _collect(service, "hello  MATE") == ["Hola che"]
+    assert service.translator.calls == 1
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [(TranslationError("LLM down"), TranslationError), (RuntimeError(), AppError)],
+)
+def test_errors_are_wrapped_the_same_way(service, error, expected):
+    service.translator = FakeTranslator(error=error)
+    with pytest.raises(expected):
+        asyncio.run(service.translate_text("Hello mate"))
+    with pytest.raises(expected):
+        _collect(service, "Hello mate")
+    # A failed translation is never cached
+    assert not service._translation_cache
+
+
+class FakeClock:
+    """A time.monotonic() replacement that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with mock.patch.object(translation_service.time, "monotonic", clock):
+        yield clock
+
+
+def test_cache_evicts_the_least_recently_used_entry(service, clock):
+    service._translation_cache_size = 2
+    service._cache_translation("a", "A")
+    service._cache_translation("b", "B")
+    # Reading "a" makes "b" the least recently used entry
+    assert service._get_cached_translation("a") == "A"
+    service._cache_translation("c", "C")
+
+    assert service._get_cached_translation("b") is None
+    assert service._get_cached_translation("a") == "A"
+    assert service._get_cached_translation("c") == "C"
+
+
+def test_cache_overwrites_move_entries_to_the_end(service, clock):
+    service._translation_cache_size = 2
+    service._cache_translation("a", "A")
+    service._cache_translation("b", "B")
+    service._cache_translation("a", "A2")
+    service._cache_translation("c", "C")
+
+    assert list(service._translation_cache) == ["a", "c"]
+    assert service._get_cached_translation("a") == "A2"
+
+
+def test_cache_entries_expire_after_the_ttl(service, clock):
+    service._translation_cache_ttl = 60.0
+    service._cache_translation("a", "A")
+
+    clock.now = 1059.0
+    assert service._get_cached_translation("a") == "A"
+    clock.now = 1060.0
+    assert service._get_cached_translation("a") is None
+    # Expired entries are dropped on lookup
+    assert "a" not in service._translation_cache
+
+
+def test_cache_can_be_disabled(service, clock):
+    service._translation_cache_size = 0
+    service._cache_translation("a", "A")
+
+    assert service._get_cached_translation("a") is None
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "hello mate",
+        "  Hello   MATE \n",
+        "Hello\tmate",
+        "Ｈｅｌｌｏ ｍａｔｅ",  # Fullwidth forms fold to ASCII under NFKC
+        "Hello\u00a0mate",  # No-break space
+    ],
+)
+def test_cache_keys_collapse_case_whitespace_and_compatibility_forms(variant):
+    assert TranslationService._normalize_cache_key(variant) == "hello mate"
+
+
+def test_cache_keys_keep_meaningful_differences():
+    normalize = TranslationService._normalize_cache_key
+    assert normalize("hello mate") != normalize("hello mate!")
+    # NFKC composes "e" + combining acute into "é", but keeps the accent
+    assert normalize("cafe\u0301") == normalize("caf\u00e9")
+    assert normalize("caf\u00e9") != normalize("cafe")